@@ -8,6 +8,10 @@ embedding generation. Vectors are generated automatically when inserting data.
 
 This file is kept for reference and backward compatibility only.
 
+Vectors are returned as contiguous float32 numpy arrays, which the Weaviate v4
+client accepts directly for vector=. (array.array is not an accepted vector
+type in the v4 client, so it is not used at that boundary.)
+
 For the new auto-vectorization approach, see:
 - weaviate/example_auto_vectorization.py
 - weaviate/README_VECTORIZER.md
@@ -20,11 +24,92 @@ warnings.warn(
     stacklevel=2
 )
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, List, Optional
+import asyncio
+import hashlib
+import logging
 import os
+import random
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
 
+# Max texts per embed_content request
+EMBED_BATCH_SIZE = 100
+
+# Max embedding requests in flight at once
+MAX_EMBED_CONCURRENCY = 5
+
+# (field, prefix) pairs for the optional parts of each combined text, in order
+_ENTITY_FIELDS = (
+    ('name', 'Entity: '),
+    ('entity_type', 'Type: '),
+    ('description', ''),
+    ('notes', 'Notes: '),
+)
+_EVENT_FIELDS = (
+    ('event_type', 'Type: '),
+    ('summary', ''),
+    ('outcomes', 'Outcomes: '),
+)
+_PROCESS_FIELDS = (
+    ('triggers', 'When to use: '),
+)
 
-def prepare_entity_vector(entity_data: Dict) -> List[float]:
+
+def build_entity_text(entity_data: Dict) -> str:
+    """Combined text that prepare_entity_vector embeds"""
+    return " | ".join(
+        f"{prefix}{value}" for key, prefix in _ENTITY_FIELDS if (value := entity_data.get(key))
+    )
+
+
+def build_insight_text(insight_content: str, source_name: Optional[str] = None) -> str:
+    """Combined text that prepare_insight_vector embeds"""
+    if source_name:
+        return f"{insight_content} | Source: {source_name}"
+    return insight_content
+
+
+def build_strategy_text(strategy_data: Dict) -> str:
+    """Combined text that prepare_strategy_vector embeds"""
+    return " | ".join((
+        f"Strategy: {strategy_data['title']}",
+        f"Type: {strategy_data.get('strategy_type', 'unknown')}",
+        strategy_data['content']
+    ))
+
+
+def build_event_text(event_data: Dict) -> str:
+    """Combined text that prepare_event_vector embeds"""
+    return " | ".join((
+        f"Event: {event_data.get('title', '')}",
+        *(f"{prefix}{value}" for key, prefix in _EVENT_FIELDS if (value := event_data.get(key)))
+    ))
+
+
+def build_process_text(process_data: Dict) -> str:
+    """Combined text that prepare_process_vector embeds"""
+    return " | ".join((
+        f"Process: {process_data['title']}",
+        process_data['content'],
+        *(f"{prefix}{value}" for key, prefix in _PROCESS_FIELDS if (value := process_data.get(key)))
+    ))
+
+
+# The prepare_* helpers embed the build_*_text output, so the embedding cache
+# is keyed on the final combined text - re-preparing the same object is a
+# dict lookup, with no API call.
+
+def prepare_entity_vector(entity_data: Dict) -> np.ndarray:
     """
     Combine entity fields and generate embedding
     
@@ -32,26 +117,12 @@ def prepare_entity_vector(entity_data: Dict) -> List[float]:
         entity_data: Dictionary with name, description, notes
     
     Returns:
-        768-dimensional vector from Google Embedding 004
+        768-dimensional float32 vector from Google Embedding 004
     """
-    # Combine relevant text fields
-    text_parts = []
-    
-    if entity_data.get('name'):
-        text_parts.append(f"Entity: {entity_data['name']}")
-    if entity_data.get('entity_type'):
-        text_parts.append(f"Type: {entity_data['entity_type']}")
-    if entity_data.get('description'):
-        text_parts.append(entity_data['description'])
-    if entity_data.get('notes'):
-        text_parts.append(f"Notes: {entity_data['notes']}")
-    
-    combined_text = " | ".join(text_parts)
-    
-    return generate_google_embedding(combined_text)
+    return generate_google_embedding(build_entity_text(entity_data))
 
 
-def prepare_insight_vector(insight_content: str, source_name: Optional[str] = None) -> List[float]:
+def prepare_insight_vector(insight_content: str, source_name: Optional[str] = None) -> np.ndarray:
     """
     Generate embedding for insight content
     
@@ -59,120 +130,310 @@ def prepare_insight_vector(insight_content: str, source_name: Optional[str] = No
         insight_content: The insight text
         source_name: Optional source for additional context
     """
-    if source_name:
-        combined_text = f"{insight_content} | Source: {source_name}"
-    else:
-        combined_text = insight_content
-    
-    return generate_google_embedding(combined_text)
+    return generate_google_embedding(build_insight_text(insight_content, source_name))
 
 
-def prepare_strategy_vector(strategy_data: Dict) -> List[float]:
+def prepare_strategy_vector(strategy_data: Dict) -> np.ndarray:
     """
     Combine strategy fields and generate embedding
     
     Args:
         strategy_data: Dictionary with title, content, strategy_type
     """
-    text_parts = [
-        f"Strategy: {strategy_data['title']}",
-        f"Type: {strategy_data.get('strategy_type', 'unknown')}",
-        strategy_data['content']
-    ]
-    combined_text = " | ".join(text_parts)
-    
-    return generate_google_embedding(combined_text)
+    return generate_google_embedding(build_strategy_text(strategy_data))
 
 
-def prepare_event_vector(event_data: Dict) -> List[float]:
+def prepare_event_vector(event_data: Dict) -> np.ndarray:
     """
     Combine event fields and generate embedding
     
     Args:
         event_data: Dictionary with title, summary, outcomes
     """
-    text_parts = [f"Event: {event_data.get('title', '')}"]
-    
-    if event_data.get('event_type'):
-        text_parts.append(f"Type: {event_data['event_type']}")
-    if event_data.get('summary'):
-        text_parts.append(event_data['summary'])
-    if event_data.get('outcomes'):
-        text_parts.append(f"Outcomes: {event_data['outcomes']}")
-    
-    combined_text = " | ".join(filter(None, text_parts))
-    
-    return generate_google_embedding(combined_text)
+    return generate_google_embedding(build_event_text(event_data))
 
 
-def prepare_process_vector(process_data: Dict) -> List[float]:
+def prepare_process_vector(process_data: Dict) -> np.ndarray:
     """
     Combine process fields and generate embedding
     
     Args:
         process_data: Dictionary with title, content, triggers
     """
-    text_parts = [
-        f"Process: {process_data['title']}",
-        process_data['content']
-    ]
+    return generate_google_embedding(build_process_text(process_data))
+
+
+# ============================================================================
+# EMBEDDING CACHE
+# ============================================================================
+
+# SQLite file for the persistent embedding cache
+EMBEDDING_CACHE_PATH = os.environ.get(
+    "NEBULA_EMBEDDING_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "nebulaos", "embeddings.sqlite3")
+)
+
+_cache_lock = threading.Lock()
+_cache_db = None
+_cache_counts = {"disk_hits": 0, "misses": 0}
+_cache_counts_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    """Bump a cache counter; called from the embedding worker threads"""
+    with _cache_counts_lock:
+        _cache_counts[name] += 1
+
+
+def _cache_key(text: str) -> str:
+    """Content hash namespaced by model, so a model change never reuses stale vectors"""
+    return hashlib.sha256(b"text-embedding-004\0" + text.encode("utf-8")).hexdigest()
+
+
+def _get_cache_db():
+    """Open (and create if needed) the on-disk cache table"""
+    global _cache_db
+    if _cache_db is None:
+        os.makedirs(os.path.dirname(EMBEDDING_CACHE_PATH), exist_ok=True)
+        _cache_db = sqlite3.connect(EMBEDDING_CACHE_PATH, check_same_thread=False)
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings_int8 (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+    return _cache_db
+
+
+def _quantize(vector: np.ndarray) -> bytes:
+    """
+    Symmetric int8 quantization for cache storage
+    
+    Stored as a float32 scale followed by one int8 per dimension -
+    772 bytes for a 768-d vector vs 3072 as float32. Embedding 004 vectors are
+    normalized, so the rounding error is negligible for retrieval.
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    scale = float(np.max(np.abs(vector))) / 127 or 1.0
+    quantized = np.round(vector / scale).astype(np.int8)
+    return np.float32(scale).tobytes() + quantized.tobytes()
+
+
+def _dequantize(blob: bytes) -> np.ndarray:
+    """Inverse of _quantize"""
+    scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+    return np.frombuffer(blob, dtype=np.int8, offset=4).astype(np.float32) * scale
+
+
+def _disk_cache_get(key: str) -> Optional[np.ndarray]:
+    with _cache_lock:
+        row = _get_cache_db().execute(
+            "SELECT vector FROM embeddings_int8 WHERE key = ?", (key,)
+        ).fetchone()
+    if row is None:
+        return None
+    return _dequantize(row[0])
+
+
+def _disk_cache_put(key: str, vector: np.ndarray) -> None:
+    with _cache_lock:
+        db = _get_cache_db()
+        db.execute(
+            "INSERT OR REPLACE INTO embeddings_int8 (key, vector) VALUES (?, ?)",
+            (key, _quantize(vector))
+        )
+        db.commit()
+
+
+@lru_cache(maxsize=10_000)
+def _cached_embedding(text: str) -> np.ndarray:
+    """In-process cache in front of the disk cache in front of the API (read-only arrays)"""
+    key = _cache_key(text)
+    
+    vector = _disk_cache_get(key)
+    if vector is not None:
+        _count("disk_hits")
+    else:
+        _count("misses")
+        vector = _request_embedding(text)
+        _disk_cache_put(key, vector)
+    
+    vector.setflags(write=False)
+    return vector
+
+
+def clear_embedding_cache() -> None:
+    """Drop all cached embeddings, in memory and on disk"""
+    _cached_embedding.cache_clear()
+    _cached_query_embedding.cache_clear()
+    with _cache_lock:
+        db = _get_cache_db()
+        db.execute("DELETE FROM embeddings_int8")
+        db.commit()
+    with _cache_counts_lock:
+        _cache_counts["disk_hits"] = 0
+        _cache_counts["misses"] = 0
+
+
+def cache_stats() -> Dict[str, int]:
+    """Hit/miss counts for the embedding cache"""
+    with _cache_counts_lock:
+        disk_hits, misses = _cache_counts["disk_hits"], _cache_counts["misses"]
+    return {
+        "memory_hits": _cached_embedding.cache_info().hits,
+        "query_hits": _cached_query_embedding.cache_info().hits,
+        "disk_hits": disk_hits,
+        "misses": misses,
+    }
+
+
+# ============================================================================
+# EMBEDDING GENERATION
+# ============================================================================
+
+_genai = None
+_genai_lock = threading.Lock()
+
+# The model's output size is fixed, so one checked response is enough
+_DEBUG = os.environ.get("NEBULA_DEBUG") == "1"
+_dimension_validated = False
+
+
+def _get_genai():
+    """Import and configure google.generativeai once per process"""
+    global _genai
+    if _genai is None:
+        with _genai_lock:
+            if _genai is None:
+                try:
+                    import google.generativeai as genai
+                except ImportError:
+                    raise ImportError(
+                        "google-generativeai not installed. "
+                        "Install with: pip install google-generativeai"
+                    )
+                
+                api_key = os.environ.get("GOOGLE_API_KEY")
+                if not api_key:
+                    raise ValueError(
+                        "GOOGLE_API_KEY not found in environment variables. "
+                        "Set it with: export GOOGLE_API_KEY='your-api-key'"
+                    )
+                
+                genai.configure(api_key=api_key)
+                _genai = genai
+    return _genai
+
+
+# Retry policy for rate-limit (429) and unavailable (503) errors
+EMBED_MAX_ATTEMPTS = 5
+EMBED_RETRY_INITIAL_DELAY = 1.0
+EMBED_RETRY_MAX_DELAY = 30.0
+
+
+def _embed_content(genai, **kwargs):
+    """genai.embed_content with exponential backoff and jitter on transient errors"""
+    from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
     
-    if process_data.get('triggers'):
-        text_parts.append(f"When to use: {process_data['triggers']}")
+    for attempt in range(EMBED_MAX_ATTEMPTS):
+        try:
+            return genai.embed_content(**kwargs)
+        except (ResourceExhausted, ServiceUnavailable) as e:
+            if attempt == EMBED_MAX_ATTEMPTS - 1:
+                raise
+            
+            # Honor the server's retry hint when a 429 carries one
+            retry_delay = getattr(e, "retry_delay", None)
+            if retry_delay is not None:
+                delay = getattr(retry_delay, "seconds", retry_delay)
+            else:
+                delay = EMBED_RETRY_INITIAL_DELAY * 2 ** attempt
+            
+            time.sleep(min(delay, EMBED_RETRY_MAX_DELAY) + random.uniform(0, 1))
+
+
+# Embedding 004 rejects inputs over 2048 tokens; clip client-side with some headroom
+MAX_EMBED_TOKENS = 2000
+
+_tokenizer = None
+_tokenizer_lock = threading.Lock()
+
+
+def _truncate(text: str, max_tokens: int = MAX_EMBED_TOKENS) -> str:
+    """
+    Clip text to roughly max_tokens before it is sent
+    
+    Uses tiktoken's cl100k_base when installed (close enough to Gemini's
+    tokenizer for bounding), otherwise ~4 characters per token.
+    """
+    global _tokenizer
+    if _tokenizer is None:
+        with _tokenizer_lock:
+            if _tokenizer is None:
+                try:
+                    import tiktoken
+                    _tokenizer = tiktoken.get_encoding("cl100k_base")
+                except ImportError:
+                    _tokenizer = False
     
-    combined_text = " | ".join(text_parts)
+    if _tokenizer:
+        tokens = _tokenizer.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        truncated = _tokenizer.decode(tokens[:max_tokens])
+    else:
+        if len(text) <= max_tokens * 4:
+            return text
+        truncated = text[:max_tokens * 4]
     
-    return generate_google_embedding(combined_text)
+    logger.debug("Truncated embedding input from %d to %d characters", len(text), len(truncated))
+    return truncated
 
 
-def generate_google_embedding(text: str) -> List[float]:
+def generate_google_embedding(text: str) -> np.ndarray:
     """
     Generate embedding using Google Embedding 004
     
+    Results are cached in memory and on disk (see EMBEDDING_CACHE_PATH),
+    so repeated texts skip the API call.
+    
     Args:
         text: Text to embed
     
     Returns:
-        768-dimensional vector
+        768-dimensional float32 vector
     """
+    return _cached_embedding(_truncate(text)).copy()
+
+
+def _request_embedding(text: str) -> np.ndarray:
+    """Call Google Embedding 004 for a single document text"""
     try:
-        import google.generativeai as genai
-        
-        # Check for API key
-        api_key = os.environ.get("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "GOOGLE_API_KEY not found in environment variables. "
-                "Set it with: export GOOGLE_API_KEY='your-api-key'"
-            )
-        
-        genai.configure(api_key=api_key)
+        genai = _get_genai()
         
         # Generate embedding
-        result = genai.embed_content(
+        result = _embed_content(
+            genai,
             model="models/text-embedding-004",
             content=text,
             task_type="retrieval_document"  # For storing in vector database
         )
         
-        embedding = result['embedding']
+        embedding = np.asarray(result['embedding'], dtype=np.float32)
         
-        # Validate dimension
-        if len(embedding) != 768:
-            raise ValueError(f"Expected 768 dimensions, got {len(embedding)}")
+        # Validate dimension on the first response (or always with NEBULA_DEBUG=1)
+        global _dimension_validated
+        if not _dimension_validated or _DEBUG:
+            if len(embedding) != 768:
+                raise ValueError(f"Expected 768 dimensions, got {len(embedding)}")
+            _dimension_validated = True
         
         return embedding
         
     except ImportError:
-        raise ImportError(
-            "google-generativeai not installed. "
-            "Install with: pip install google-generativeai"
-        )
+        raise
     except Exception as e:
         raise RuntimeError(f"Failed to generate embedding: {str(e)}")
 
 
-def generate_query_embedding(query_text: str) -> List[float]:
+def generate_query_embedding(query_text: str) -> np.ndarray:
     """
     Generate embedding for search queries
     
@@ -181,69 +442,199 @@ def generate_query_embedding(query_text: str) -> List[float]:
     
     Returns:
         768-dimensional vector optimized for retrieval
+    
+    Repeated queries (pagination, retries) are served from an in-process cache.
     """
+    return _cached_query_embedding(_truncate(query_text)).copy()
+
+
+@lru_cache(maxsize=512)
+def _cached_query_embedding(query_text: str) -> np.ndarray:
+    """Query embeddings keyed on text - task_type is fixed to retrieval_query"""
     try:
-        import google.generativeai as genai
-        
-        api_key = os.environ.get("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in environment variables")
-        
-        genai.configure(api_key=api_key)
+        genai = _get_genai()
         
         # Use retrieval_query task type for searches
-        result = genai.embed_content(
+        result = _embed_content(
+            genai,
             model="models/text-embedding-004",
             content=query_text,
             task_type="retrieval_query"  # For searching
         )
         
-        return result['embedding']
+        embedding = np.asarray(result['embedding'], dtype=np.float32)
+        embedding.setflags(write=False)
+        return embedding
         
     except ImportError:
-        raise ImportError("google-generativeai not installed")
+        raise
     except Exception as e:
         raise RuntimeError(f"Failed to generate query embedding: {str(e)}")
 
 
-def batch_generate_embeddings(texts: List[str]) -> List[List[float]]:
+def _embed_batch(genai, chunk: List[str]) -> List[np.ndarray]:
+    """Embed one sub-batch in a single request, falling back to per-text requests"""
+    result = _embed_content(
+        genai,
+        model="models/text-embedding-004",
+        content=chunk,
+        task_type="retrieval_document"
+    )
+    
+    vectors = result.get('embedding') if isinstance(result, dict) else None
+    if vectors and len(vectors) == len(chunk) and isinstance(vectors[0], list):
+        return [np.asarray(vector, dtype=np.float32) for vector in vectors]
+    
+    # Response wasn't batched - fall back to one request per text
+    embeddings = []
+    for text in chunk:
+        result = _embed_content(
+            genai,
+            model="models/text-embedding-004",
+            content=text,
+            task_type="retrieval_document"
+        )
+        embeddings.append(np.asarray(result['embedding'], dtype=np.float32))
+    return embeddings
+
+
+def batch_generate_embeddings(
+    texts: List[str],
+    batch_size: int = EMBED_BATCH_SIZE,
+    max_concurrency: int = MAX_EMBED_CONCURRENCY
+) -> List[np.ndarray]:
     """
     Generate embeddings for multiple texts in batch
     
     Args:
         texts: List of texts to embed
+        batch_size: Max texts per API request (keeps requests under token limits)
+        max_concurrency: Max sub-batches in flight at once
     
     Returns:
-        List of 768-dimensional vectors
+        List of 768-dimensional float32 vectors, in the same order as texts
     """
     try:
-        import google.generativeai as genai
-        
-        api_key = os.environ.get("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in environment variables")
-        
-        genai.configure(api_key=api_key)
-        
-        embeddings = []
+        # Embed each distinct text once; cached texts skip the API entirely
+        unique = {}
+        pending = []
+        texts = [_truncate(text) for text in texts]
+        for text in dict.fromkeys(texts):
+            vector = _disk_cache_get(_cache_key(text))
+            if vector is not None:
+                _count("disk_hits")
+                unique[text] = vector
+            else:
+                pending.append(text)
         
-        # Google API supports batch processing
-        for text in texts:
-            result = genai.embed_content(
-                model="models/text-embedding-004",
-                content=text,
-                task_type="retrieval_document"
-            )
-            embeddings.append(result['embedding'])
+        if pending:
+            genai = _get_genai()
+            
+            chunks = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+            results = [None] * len(chunks)
+            
+            # Sub-batches are pure network wait, so threads overlap the round-trips
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = {}
+                for index, chunk in enumerate(chunks):
+                    # Small jitter so concurrent requests don't hit the quota in lockstep
+                    time.sleep(random.uniform(0, 0.05))
+                    futures[executor.submit(_embed_batch, genai, chunk)] = index
+                
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            
+            for chunk, vectors in zip(chunks, results):
+                for text, vector in zip(chunk, vectors):
+                    _count("misses")
+                    _disk_cache_put(_cache_key(text), vector)
+                    unique[text] = vector
         
-        return embeddings
+        # Scatter back to input order, duplicates included
+        return [unique[text].copy() for text in texts]
         
     except ImportError:
-        raise ImportError("google-generativeai not installed")
+        raise
     except Exception as e:
         raise RuntimeError(f"Failed to generate batch embeddings: {str(e)}")
 
 
+# ============================================================================
+# ASYNC API
+# ============================================================================
+
+# Max embedding requests in flight at once from the async helpers
+MAX_ASYNC_EMBED_CONCURRENCY = 10
+
+
+async def agenerate_google_embedding(text: str) -> np.ndarray:
+    """Async generate_google_embedding - runs the blocking call off the event loop"""
+    return await asyncio.to_thread(generate_google_embedding, text)
+
+
+async def agenerate_query_embedding(query_text: str) -> np.ndarray:
+    """Async generate_query_embedding - runs the blocking call off the event loop"""
+    return await asyncio.to_thread(generate_query_embedding, query_text)
+
+
+async def aprepare_entity_vector(entity_data: Dict) -> np.ndarray:
+    """Async prepare_entity_vector"""
+    return await asyncio.to_thread(prepare_entity_vector, entity_data)
+
+
+async def aprepare_insight_vector(insight_content: str, source_name: Optional[str] = None) -> np.ndarray:
+    """Async prepare_insight_vector"""
+    return await asyncio.to_thread(prepare_insight_vector, insight_content, source_name)
+
+
+async def aprepare_strategy_vector(strategy_data: Dict) -> np.ndarray:
+    """Async prepare_strategy_vector"""
+    return await asyncio.to_thread(prepare_strategy_vector, strategy_data)
+
+
+async def aprepare_event_vector(event_data: Dict) -> np.ndarray:
+    """Async prepare_event_vector"""
+    return await asyncio.to_thread(prepare_event_vector, event_data)
+
+
+async def aprepare_process_vector(process_data: Dict) -> np.ndarray:
+    """Async prepare_process_vector"""
+    return await asyncio.to_thread(prepare_process_vector, process_data)
+
+
+async def abatch_generate_embeddings(
+    texts: List[str],
+    batch_size: int = EMBED_BATCH_SIZE
+) -> List[np.ndarray]:
+    """
+    Async batch_generate_embeddings
+    
+    Sub-batches run concurrently, bounded by MAX_ASYNC_EMBED_CONCURRENCY.
+    
+    Args:
+        texts: List of texts to embed
+        batch_size: Max texts per API request
+    
+    Returns:
+        List of 768-dimensional float32 vectors, in the same order as texts
+    """
+    semaphore = asyncio.Semaphore(MAX_ASYNC_EMBED_CONCURRENCY)
+    
+    async def embed_chunk(chunk: List[str]) -> List[np.ndarray]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                batch_generate_embeddings, chunk, batch_size=batch_size, max_concurrency=1
+            )
+    
+    chunks = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+    results = await asyncio.gather(*[embed_chunk(chunk) for chunk in chunks])
+    
+    embeddings = []
+    for vectors in results:
+        embeddings.extend(vectors)
+    return embeddings
+
+
 # Test function
 def test_embedding_setup():
     """Test that embedding generation is working"""
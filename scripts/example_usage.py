@@ -15,156 +15,86 @@ This file is kept for reference purposes only.
 import weaviate
 from weaviate.classes.query import Filter
 from datetime import datetime, timezone
+import uuid
 from embedding_helpers import (
-    prepare_entity_vector,
-    prepare_insight_vector,
-    prepare_strategy_vector,
-    prepare_event_vector,
-    prepare_process_vector,
+    build_entity_text,
+    build_insight_text,
+    build_strategy_text,
+    build_event_text,
+    build_process_text,
+    batch_generate_embeddings,
     generate_query_embedding
 )
 
 
-def example_create_entity(client):
-    """Example: Create an entity with Google Embedding"""
-    
-    print("📝 Creating Entity: KPMG\n")
-    
-    entity_data = {
+def entity_example_data(now=None):
+    """Example entity properties, timestamped with now (default: current UTC time)"""
+    now = now or datetime.now(timezone.utc)
+    return {
         "name": "KPMG",
         "entity_type": "company",
         "domain": "work",
         "description": "Big 4 consulting firm. Key partner for AI Governance workshops.",
         "notes": "Prefer structured agendas. Jean is primary contact - responsive on email.",
         "status": "active",
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc)
+        "created_at": now,
+        "updated_at": now
     }
-    
-    # Generate embedding from entity data
-    entity_vector = prepare_entity_vector(entity_data)
-    
-    entity_collection = client.collections.get("Entity")
-    entity_uuid = entity_collection.data.insert(
-        properties=entity_data,
-        vector=entity_vector
-    )
-    
-    print(f"✅ Created Entity with UUID: {entity_uuid}\n")
-    return entity_uuid
 
 
-def example_create_insight_with_references(client, entity_uuid):
-    """Example: Create insight and link to entity"""
-    
-    print("📝 Creating Insight with cross-reference\n")
-    
-    insight_content = "Prompt chaining with explicit handoff context reduces hallucination rates by 40%"
-    
-    # Generate embedding for the insight
-    insight_vector = prepare_insight_vector(
-        insight_content,
-        source_name="Building Effective Agents - Anthropic Blog"
-    )
-    
-    insight_collection = client.collections.get("Insight")
-    insight_uuid = insight_collection.data.insert(
-        properties={
-            "content": insight_content,
-            "source_name": "Building Effective Agents - Anthropic Blog",
-            "source_type": "article",
-            "domain": "both",
-            "tags": ["ai-agents", "prompt-engineering", "reliability"],
-            "status": "active",
-            "confidence": "high",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        },
-        vector=insight_vector,
-        references={
-            "relatedEntities": [entity_uuid]  # Link to KPMG entity
-        }
-    )
-    
-    print(f"✅ Created Insight with UUID: {insight_uuid}")
-    print(f"   Linked to Entity: {entity_uuid}\n")
-    return insight_uuid
+def insight_example_data(now=None):
+    """Example insight properties, timestamped with now (default: current UTC time)"""
+    now = now or datetime.now(timezone.utc)
+    return {
+        "content": "Prompt chaining with explicit handoff context reduces hallucination rates by 40%",
+        "source_name": "Building Effective Agents - Anthropic Blog",
+        "source_type": "article",
+        "domain": "both",
+        "tags": ["ai-agents", "prompt-engineering", "reliability"],
+        "status": "active",
+        "confidence": "high",
+        "created_at": now,
+        "updated_at": now
+    }
 
 
-def example_create_strategy(client, entity_uuid):
-    """Example: Create a strategy"""
-    
-    print("📝 Creating Strategy\n")
-    
-    strategy_data = {
+def strategy_example_data(now=None):
+    """Example strategy properties, timestamped with now (default: current UTC time)"""
+    now = now or datetime.now(timezone.utc)
+    return {
         "title": "Q1 2025 Product Priorities",
         "content": "Focus on AI agent reliability, user feedback loops, and enterprise integration features.",
         "strategy_type": "priority",
         "domain": "work",
         "time_horizon": "quarterly",
-        "valid_from": datetime.now(timezone.utc),
+        "valid_from": now,
         "status": "active",
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc)
+        "created_at": now,
+        "updated_at": now
     }
-    
-    strategy_vector = prepare_strategy_vector(strategy_data)
-    
-    strategy_collection = client.collections.get("Strategy")
-    strategy_uuid = strategy_collection.data.insert(
-        properties=strategy_data,
-        vector=strategy_vector,
-        references={
-            "appliesToEntities": [entity_uuid]
-        }
-    )
-    
-    print(f"✅ Created Strategy with UUID: {strategy_uuid}\n")
-    return strategy_uuid
 
 
-def example_create_event(client, entity_uuid, insight_uuid, strategy_uuid):
-    """Example: Create an event with multiple references"""
-    
-    print("📝 Creating Event\n")
-    
-    event_data = {
+def event_example_data(now=None):
+    """Example event properties, timestamped with now (default: current UTC time)"""
+    now = now or datetime.now(timezone.utc)
+    return {
         "title": "KPMG Workshop Planning",
         "event_type": "meeting",
         "summary": "Discussed AI governance framework and workshop structure for March delivery.",
         "participants": ["Jean (KPMG Lead)", "Marie (Product)", "Alex (Technical)"],
         "domain": "work",
-        "event_date": datetime.now(timezone.utc),
+        "event_date": now,
         "outcomes": "Agreed on 3-day workshop format with hands-on sessions.",
         "action_items": "1. Draft agenda by Friday\n2. Prepare case studies\n3. Book venue",
         "open_questions": "Budget approval timeline? Participant capacity?",
-        "created_at": datetime.now(timezone.utc)
+        "created_at": now
     }
-    
-    event_vector = prepare_event_vector(event_data)
-    
-    event_collection = client.collections.get("Event")
-    event_uuid = event_collection.data.insert(
-        properties=event_data,
-        vector=event_vector,
-        references={
-            "involvesEntities": [entity_uuid],
-            "generatedInsights": [insight_uuid],
-            "relatesToStrategies": [strategy_uuid]
-        }
-    )
-    
-    print(f"✅ Created Event with UUID: {event_uuid}")
-    print(f"   Linked to Entity, Insight, and Strategy\n")
-    return event_uuid
 
 
-def example_create_process(client, entity_uuid, strategy_uuid):
-    """Example: Create a process"""
-    
-    print("📝 Creating Process\n")
-    
-    process_data = {
+def process_example_data(now=None):
+    """Example process properties, timestamped with now (default: current UTC time)"""
+    now = now or datetime.now(timezone.utc)
+    return {
         "title": "Stakeholder Update Cadence",
         "content": """Weekly stakeholder updates following this structure:
 1. Progress since last update
@@ -176,24 +106,88 @@ Keep updates concise (max 5 minutes). Use Slack for async updates, meetings for
         "domain": "work",
         "triggers": "Every Friday EOD, or when major milestone reached, or when blocker needs escalation",
         "status": "active",
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc)
+        "created_at": now,
+        "updated_at": now
     }
-    
-    process_vector = prepare_process_vector(process_data)
-    
-    process_collection = client.collections.get("Process")
-    process_uuid = process_collection.data.insert(
-        properties=process_data,
-        vector=process_vector,
-        references={
-            "appliesToEntities": [entity_uuid],
-            "relatedStrategies": [strategy_uuid]
-        }
-    )
-    
+
+
+def example_create_all(client):
+    """Example: Create all five objects with one embedding request and one batch insert"""
+    
+    print("📝 Creating Entity, Insight, Strategy, Event and Process in one batch\n")
+    
+    now = datetime.now(timezone.utc)
+    entity_data = entity_example_data(now)
+    insight_data = insight_example_data(now)
+    strategy_data = strategy_example_data(now)
+    event_data = event_example_data(now)
+    process_data = process_example_data(now)
+    
+    # One embedding round-trip for all five objects
+    entity_vector, insight_vector, strategy_vector, event_vector, process_vector = batch_generate_embeddings([
+        build_entity_text(entity_data),
+        build_insight_text(insight_data["content"], insight_data["source_name"]),
+        build_strategy_text(strategy_data),
+        build_event_text(event_data),
+        build_process_text(process_data),
+    ])
+    
+    # UUIDs are generated client-side so cross-references can go in the same batch
+    entity_uuid, insight_uuid, strategy_uuid, event_uuid, process_uuid = (uuid.uuid4() for _ in range(5))
+    
+    with client.batch.dynamic() as batch:
+        batch.add_object(
+            collection="Entity",
+            properties=entity_data,
+            uuid=entity_uuid,
+            vector=entity_vector
+        )
+        batch.add_object(
+            collection="Insight",
+            properties=insight_data,
+            uuid=insight_uuid,
+            vector=insight_vector,
+            references={"relatedEntities": [entity_uuid]}
+        )
+        batch.add_object(
+            collection="Strategy",
+            properties=strategy_data,
+            uuid=strategy_uuid,
+            vector=strategy_vector,
+            references={"appliesToEntities": [entity_uuid]}
+        )
+        batch.add_object(
+            collection="Event",
+            properties=event_data,
+            uuid=event_uuid,
+            vector=event_vector,
+            references={
+                "involvesEntities": [entity_uuid],
+                "generatedInsights": [insight_uuid],
+                "relatesToStrategies": [strategy_uuid]
+            }
+        )
+        batch.add_object(
+            collection="Process",
+            properties=process_data,
+            uuid=process_uuid,
+            vector=process_vector,
+            references={
+                "appliesToEntities": [entity_uuid],
+                "relatedStrategies": [strategy_uuid]
+            }
+        )
+    
+    failed = client.batch.failed_objects
+    if failed:
+        raise RuntimeError(f"{len(failed)} objects failed to insert: {failed[0].message}")
+    
+    print(f"✅ Created Entity with UUID: {entity_uuid}")
+    print(f"✅ Created Insight with UUID: {insight_uuid}")
+    print(f"✅ Created Strategy with UUID: {strategy_uuid}")
+    print(f"✅ Created Event with UUID: {event_uuid}")
     print(f"✅ Created Process with UUID: {process_uuid}\n")
-    return process_uuid
+    return entity_uuid, insight_uuid, strategy_uuid, event_uuid, process_uuid
 
 
 def example_semantic_search(client):
@@ -339,11 +333,7 @@ def main():
         print()
         
         # Create example data
-        entity_uuid = example_create_entity(client)
-        insight_uuid = example_create_insight_with_references(client, entity_uuid)
-        strategy_uuid = example_create_strategy(client, entity_uuid)
-        event_uuid = example_create_event(client, entity_uuid, insight_uuid, strategy_uuid)
-        process_uuid = example_create_process(client, entity_uuid, strategy_uuid)
+        entity_uuid, insight_uuid, strategy_uuid, event_uuid, process_uuid = example_create_all(client)
         
         print("=" * 60)
         print()
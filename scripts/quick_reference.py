@@ -12,8 +12,25 @@ This file is kept for reference purposes.
 
 import weaviate
 from weaviate.classes.query import Filter, QueryReference
+from weaviate.config import AdditionalConfig, ConnectionConfig, Timeout
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from typing import Final
+import atexit
 import os
+import queue
+import sys
+import threading
+import time
+import weakref
+
+# The batch helper is shared with the scripts in weaviate/
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "weaviate"))
+from _client import BATCH_CONCURRENCY, BATCH_SIZE, batch_insert
+
+
+COLLECTION_NAMES: Final[tuple[str, ...]] = ("Entity", "Insight", "Strategy", "Event", "Process")
 
 
 # ============================================================================
@@ -26,19 +43,80 @@ def connect():
         host="localhost",
         port=8081,
         grpc_port=50051,
-        auth_credentials=weaviate.auth.AuthApiKey(os.environ.get("WEAVIATE_API_KEY"))
+        auth_credentials=weaviate.auth.AuthApiKey(os.environ.get("WEAVIATE_API_KEY")),
+        additional_config=AdditionalConfig(
+            # Generous limits so long-lived ingestion sessions don't time out
+            timeout=Timeout(init=30, query=60, insert=120),
+            # Pooled HTTP connections for the REST calls made by concurrent helpers
+            connection=ConnectionConfig(session_pool_connections=20, session_pool_maxsize=100)
+        )
     )
 
 
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Shared client reused by every helper below, closed at interpreter exit"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = connect()
+                atexit.register(close_client)
+    return _client
+
+
+def close_client():
+    """Close the shared client; the next get_client() call reconnects"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+@contextmanager
+def nebula_session():
+    """
+    Dedicated client for a group of operations
+    
+    Usage:
+        with nebula_session() as client:
+            entity = query_by_name("KPMG", client=client)
+            context = get_entity_context("KPMG", client=client)
+    """
+    client = connect()
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+_collections = weakref.WeakKeyDictionary()
+_collections_lock = threading.Lock()
+
+
+def _collection(client, name):
+    """Collection handle for client, built once and reused while the client lives"""
+    with _collections_lock:
+        handles = _collections.setdefault(client, {})
+        if name not in handles:
+            handles[name] = client.collections.get(name)
+        return handles[name]
+
+
 # ============================================================================
 # CREATE OPERATIONS
 # ============================================================================
 
-def create_entity_example():
+def create_entity_example(client=None):
     """Create an entity"""
     from embedding_helpers import prepare_entity_vector
     
-    client = connect()
+    client = client or get_client()
+    now = datetime.now(timezone.utc)
     
     entity_data = {
         "name": "Example Corp",
@@ -47,29 +125,29 @@ def create_entity_example():
         "description": "Example company description",
         "notes": "Important notes here",
         "status": "active",
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc)
+        "created_at": now,
+        "updated_at": now
     }
     
     vector = prepare_entity_vector(entity_data)
     
-    collection = client.collections.get("Entity")
+    collection = _collection(client, "Entity")
     uuid = collection.data.insert(properties=entity_data, vector=vector)
-    
-    client.close()
+    invalidate_stats_cache("Entity")
     return uuid
 
 
-def create_insight_with_refs(entity_uuid, strategy_uuid):
+def create_insight_with_refs(entity_uuid, strategy_uuid, client=None):
     """Create insight with references"""
     from embedding_helpers import prepare_insight_vector
     
-    client = connect()
+    client = client or get_client()
+    now = datetime.now(timezone.utc)
     
     content = "Your insight content here"
     vector = prepare_insight_vector(content, "Source Name")
     
-    collection = client.collections.get("Insight")
+    collection = _collection(client, "Insight")
     uuid = collection.data.insert(
         properties={
             "content": content,
@@ -79,8 +157,8 @@ def create_insight_with_refs(entity_uuid, strategy_uuid):
             "tags": ["tag1", "tag2"],
             "status": "active",
             "confidence": "high",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
+            "created_at": now,
+            "updated_at": now
         },
         vector=vector,
         references={
@@ -88,8 +166,7 @@ def create_insight_with_refs(entity_uuid, strategy_uuid):
             "relatedStrategies": [strategy_uuid]
         }
     )
-    
-    client.close()
+    invalidate_stats_cache("Insight")
     return uuid
 
 
@@ -97,30 +174,29 @@ def create_insight_with_refs(entity_uuid, strategy_uuid):
 # QUERY OPERATIONS
 # ============================================================================
 
-def query_by_name(name):
+def query_by_name(name, client=None):
     """Find entity by exact name"""
-    client = connect()
+    client = client or get_client()
     
-    collection = client.collections.get("Entity")
+    collection = _collection(client, "Entity")
     response = collection.query.fetch_objects(
         filters=Filter.by_property("name").equal(name),
         limit=1
     )
     
     result = response.objects[0] if response.objects else None
-    client.close()
     return result
 
 
-def semantic_search(query_text, collection_name="Insight", limit=5):
+def semantic_search(query_text, collection_name="Insight", limit=5, client=None):
     """Semantic search using vector similarity"""
     from embedding_helpers import generate_query_embedding
     
-    client = connect()
+    client = client or get_client()
     
     query_vector = generate_query_embedding(query_text)
     
-    collection = client.collections.get(collection_name)
+    collection = _collection(client, collection_name)
     response = collection.query.near_vector(
         near_vector=query_vector,
         limit=limit,
@@ -128,15 +204,14 @@ def semantic_search(query_text, collection_name="Insight", limit=5):
     )
     
     results = response.objects
-    client.close()
     return results
 
 
-def query_active_work_entities():
+def query_active_work_entities(client=None):
     """Find all active work entities"""
-    client = connect()
+    client = client or get_client()
     
-    collection = client.collections.get("Entity")
+    collection = _collection(client, "Entity")
     response = collection.query.fetch_objects(
         filters=(
             Filter.by_property("domain").equal("work") &
@@ -146,15 +221,14 @@ def query_active_work_entities():
     )
     
     results = response.objects
-    client.close()
     return results
 
 
-def query_with_references(insight_content_pattern):
+def query_with_references(insight_content_pattern, client=None):
     """Query insights and return with references"""
-    client = connect()
+    client = client or get_client()
     
-    collection = client.collections.get("Insight")
+    collection = _collection(client, "Insight")
     response = collection.query.fetch_objects(
         filters=Filter.by_property("content").like(f"*{insight_content_pattern}*"),
         return_references=[
@@ -165,44 +239,42 @@ def query_with_references(insight_content_pattern):
     )
     
     results = response.objects
-    client.close()
     return results
 
 
-def get_entity_context(entity_name):
+def get_entity_context(entity_name, client=None):
     """Get full context for an entity: events, strategies, insights"""
-    client = connect()
+    client = client or get_client()
     
     # Get entity
-    entity_collection = client.collections.get("Entity")
+    entity_collection = _collection(client, "Entity")
     entity_response = entity_collection.query.fetch_objects(
         filters=Filter.by_property("name").equal(entity_name),
         limit=1
     )
     
     if not entity_response.objects:
-        client.close()
         return None
     
     entity = entity_response.objects[0]
     entity_uuid = entity.uuid
     
     # Get related events
-    event_collection = client.collections.get("Event")
+    event_collection = _collection(client, "Event")
     events = event_collection.query.fetch_objects(
         filters=Filter.by_ref("involvesEntities").by_id().equal(entity_uuid),
         limit=20
     )
     
     # Get related strategies
-    strategy_collection = client.collections.get("Strategy")
+    strategy_collection = _collection(client, "Strategy")
     strategies = strategy_collection.query.fetch_objects(
         filters=Filter.by_ref("appliesToEntities").by_id().equal(entity_uuid),
         limit=20
     )
     
     # Get related insights
-    insight_collection = client.collections.get("Insight")
+    insight_collection = _collection(client, "Insight")
     insights = insight_collection.query.fetch_objects(
         filters=Filter.by_ref("relatedEntities").by_id().equal(entity_uuid),
         limit=20
@@ -214,8 +286,6 @@ def get_entity_context(entity_name):
         "strategies": strategies.objects,
         "insights": insights.objects
     }
-    
-    client.close()
     return context
 
 
@@ -223,11 +293,11 @@ def get_entity_context(entity_name):
 # UPDATE OPERATIONS
 # ============================================================================
 
-def update_entity_status(entity_uuid, new_status):
+def update_entity_status(entity_uuid, new_status, client=None):
     """Update entity status"""
-    client = connect()
+    client = client or get_client()
     
-    collection = client.collections.get("Entity")
+    collection = _collection(client, "Entity")
     collection.data.update(
         uuid=entity_uuid,
         properties={
@@ -235,43 +305,38 @@ def update_entity_status(entity_uuid, new_status):
             "updated_at": datetime.now(timezone.utc)
         }
     )
-    
-    client.close()
 
 
-def add_reference(from_uuid, from_collection, to_uuid, reference_property):
+def add_reference(from_uuid, from_collection, to_uuid, reference_property, client=None):
     """Add a cross-reference between objects"""
-    client = connect()
+    client = client or get_client()
     
-    collection = client.collections.get(from_collection)
+    collection = _collection(client, from_collection)
     collection.data.reference_add(
         from_uuid=from_uuid,
         from_property=reference_property,
         to=to_uuid
     )
-    
-    client.close()
 
 
 # ============================================================================
 # DELETE OPERATIONS
 # ============================================================================
 
-def delete_object(collection_name, uuid):
+def delete_object(collection_name, uuid, client=None):
     """Delete an object by UUID"""
-    client = connect()
+    client = client or get_client()
     
-    collection = client.collections.get(collection_name)
+    collection = _collection(client, collection_name)
     collection.data.delete_by_id(uuid)
-    
-    client.close()
+    invalidate_stats_cache(collection_name)
 
 
-def archive_insight(insight_uuid, superseded_by_uuid=None):
+def archive_insight(insight_uuid, superseded_by_uuid=None, client=None):
     """Archive an insight (mark as superseded)"""
-    client = connect()
+    client = client or get_client()
     
-    collection = client.collections.get("Insight")
+    collection = _collection(client, "Insight")
     update_data = {
         "status": "superseded" if superseded_by_uuid else "archived",
         "updated_at": datetime.now(timezone.utc)
@@ -281,69 +346,159 @@ def archive_insight(insight_uuid, superseded_by_uuid=None):
         update_data["superseded_by"] = superseded_by_uuid
     
     collection.data.update(uuid=insight_uuid, properties=update_data)
-    
-    client.close()
 
 
 # ============================================================================
 # BATCH OPERATIONS
 # ============================================================================
 
-def batch_insert_entities(entities_data):
-    """Insert multiple entities in batch"""
+def batch_insert_entities(entities_data, client=None, embed_workers=4):
+    """
+    Insert multiple entities in batch
+    
+    Embeddings are generated on worker threads and handed to the batch as they
+    complete, so Google API latency overlaps with Weaviate inserts.
+    """
     from embedding_helpers import prepare_entity_vector
     
-    client = connect()
-    collection = client.collections.get("Entity")
+    client = client or get_client()
+    collection = _collection(client, "Entity")
+    
+    entities_data = list(entities_data)
+    ready = queue.Queue(maxsize=64)
+    cancelled = threading.Event()
+    
+    def embed(index, entity_data):
+        if cancelled.is_set():
+            ready.put((index, entity_data, None))
+            return
+        try:
+            ready.put((index, entity_data, prepare_entity_vector(entity_data)))
+        except Exception as e:
+            ready.put((index, entity_data, e))
+    
+    uuids = [None] * len(entities_data)
+    error = None
+    received = 0
+    try:
+        with ThreadPoolExecutor(max_workers=embed_workers) as executor:
+            for index, entity_data in enumerate(entities_data):
+                executor.submit(embed, index, entity_data)
+            
+            try:
+                with collection.batch.dynamic() as batch:
+                    # Keep draining after an embedding failure so blocked producers can finish
+                    while received < len(entities_data):
+                        index, entity_data, vector = ready.get()
+                        received += 1
+                        if isinstance(vector, Exception):
+                            error = error or vector
+                        elif error is None:
+                            uuids[index] = batch.add_object(properties=entity_data, vector=vector)
+            finally:
+                # If the batch itself raised, skip the remaining embeds and
+                # consume what is left so no worker stays blocked on the
+                # bounded queue and the executor can shut down
+                cancelled.set()
+                for _ in range(received, len(entities_data)):
+                    ready.get()
+    finally:
+        invalidate_stats_cache("Entity")
+    
+    if error is not None:
+        raise error
+    return uuids
+
+
+def bulk_insert(collection_name, objects, batch_size=BATCH_SIZE, num_workers=BATCH_CONCURRENCY, client=None):
+    """
+    Insert property dicts into one collection using fixed-size batches
     
-    uuids = []
-    with collection.batch.dynamic() as batch:
-        for entity_data in entities_data:
-            vector = prepare_entity_vector(entity_data)
-            uuid = batch.add_object(properties=entity_data, vector=vector)
-            uuids.append(uuid)
+    Vectors are left to the collection's vectorizer. Raises if any object fails.
+    """
+    client = client or get_client()
     
-    client.close()
-    return uuids
+    try:
+        return batch_insert(client, collection_name, objects,
+                            batch_size=batch_size, concurrent_requests=num_workers)
+    finally:
+        invalidate_stats_cache(collection_name)
 
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def get_collection_stats():
-    """Get object counts for all collections"""
-    client = connect()
+STATS_TTL_SECONDS = 30
+
+_stats_cache = {}
+_stats_cache_lock = threading.Lock()
+
+
+def invalidate_stats_cache(collection_name=None):
+    """Drop cached counts for one collection, or all of them"""
+    with _stats_cache_lock:
+        if collection_name is None:
+            _stats_cache.clear()
+        else:
+            _stats_cache.pop(collection_name, None)
+
+
+def get_collection_stats(client=None):
+    """Get object counts for all collections (cached for STATS_TTL_SECONDS)"""
+    client = client or get_client()
     
-    stats = {}
-    for name in ["Entity", "Insight", "Strategy", "Event", "Process"]:
-        collection = client.collections.get(name)
-        response = collection.aggregate.over_all(total_count=True)
-        stats[name] = response.total_count
+    now = time.monotonic()
+    with _stats_cache_lock:
+        stats = {
+            name: entry[0] for name, entry in _stats_cache.items()
+            if name in COLLECTION_NAMES and now - entry[1] < STATS_TTL_SECONDS
+        }
+    stale = [name for name in COLLECTION_NAMES if name not in stats]
+    
+    def count(name):
+        return _collection(client, name).aggregate.over_all(total_count=True).total_count
     
-    client.close()
-    return stats
+    if stale:
+        # Independent round-trips, so run them concurrently over the shared connection
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            futures = {name: executor.submit(count, name) for name in stale}
+            fresh = {name: future.result() for name, future in futures.items()}
+        with _stats_cache_lock:
+            for name, total in fresh.items():
+                _stats_cache[name] = (total, now)
+        stats.update(fresh)
+    
+    return {name: stats[name] for name in COLLECTION_NAMES}
 
 
-def search_by_tags(tags, collection_name="Insight"):
-    """Find insights/content by tags"""
-    client = connect()
+# Built once; contains_any() returns a fresh filter without mutating it
+_TAGS_FILTER = Filter.by_property("tags")
+
+
+def search_by_tags(tags, collection_name="Insight", limit=10, offset=0,
+                   return_properties=("content", "tags", "source_name"), client=None):
+    """
+    Find insights/content by tags, one page at a time
     
-    collection = client.collections.get(collection_name)
+    Only the properties in return_properties are fetched; pass None for all.
+    Page with offset=limit, offset=2*limit, ... Weaviate's `after` cursor can't
+    be combined with filters, so listing a whole collection should use
+    collection.iterator() instead.
+    """
+    client = client or get_client()
     
-    # Build filter for tags
-    if len(tags) == 1:
-        filter_obj = Filter.by_property("tags").contains_any(tags)
-    else:
-        filter_obj = Filter.by_property("tags").contains_any(tags)
+    # Handle and property filter are both pre-built; only contains_any runs per call
+    collection = _collection(client, collection_name)
     
     response = collection.query.fetch_objects(
-        filters=filter_obj,
-        limit=50
+        filters=_TAGS_FILTER.contains_any(tags),
+        limit=limit,
+        offset=offset,
+        return_properties=list(return_properties) if return_properties is not None else None
     )
     
     results = response.objects
-    client.close()
     return results
 
 
@@ -0,0 +1,111 @@
+"""
+Shared Weaviate client for the scripts in this directory
+
+The client is created on first use and closed at interpreter exit, so
+repeated calls within one process reuse a single connection instead of
+reconnecting each time.
+"""
+
+import weaviate
+from weaviate.config import AdditionalConfig, Timeout
+import atexit
+import os
+import threading
+import weakref
+
+
+_client = None
+_client_lock = threading.Lock()
+
+_collections = weakref.WeakKeyDictionary()
+_collections_lock = threading.Lock()
+
+# Objects per batch request and batch requests in flight, for batch_insert()
+BATCH_SIZE = 200
+BATCH_CONCURRENCY = 4
+
+
+def _connection_params():
+    """Connection settings shared by the sync and async clients"""
+    api_key = os.environ.get("WEAVIATE_API_KEY")
+
+    return dict(
+        host="localhost",
+        port=8081,
+        grpc_port=50051,
+        auth_credentials=weaviate.auth.AuthApiKey(api_key) if api_key else None,
+        # Queries and batches go over gRPC on grpc_port; the init checks stay
+        # on so a closed gRPC port fails at connect time instead of mid-test
+        additional_config=AdditionalConfig(timeout=Timeout(init=10, query=30, insert=120))
+    )
+
+
+def _connect():
+    """Connect to the local Weaviate instance"""
+    return weaviate.connect_to_local(**_connection_params())
+
+
+def async_client():
+    """
+    New async client for the local Weaviate instance
+
+    Use as 'async with async_client() as client:'. It is not shared like
+    get_client(), because an async client is bound to the event loop that
+    opened it.
+    """
+    return weaviate.use_async_with_local(**_connection_params())
+
+
+def get_client():
+    """Process-wide client, connected on first call and closed at exit"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _connect()
+                atexit.register(close_client)
+    return _client
+
+
+def coll(client, name):
+    """Collection handle for client, built once and reused while the client lives"""
+    with _collections_lock:
+        handles = _collections.setdefault(client, {})
+        if name not in handles:
+            handles[name] = client.collections.get(name)
+        return handles[name]
+
+
+def close_client():
+    """Close the shared client; the next get_client() call reconnects"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            with _collections_lock:
+                _collections.pop(_client, None)
+            _client.close()
+            _client = None
+
+
+def batch_insert(client, collection_name, objects, refs=None, uuids=None,
+                 batch_size=BATCH_SIZE, concurrent_requests=BATCH_CONCURRENCY):
+    """
+    Insert property dicts into a collection in fixed-size batches
+    
+    refs and uuids, if given, are lists parallel to objects holding each
+    object's references dict and UUID (or None). Vectors are left to the
+    collection's vectorizer, and each batch is one request instead of one
+    per object. Returns the new UUIDs; raises if any object fails.
+    """
+    collection = coll(client, collection_name)
+    refs = refs or [None] * len(objects)
+    uuids = uuids or [None] * len(objects)
+    
+    with collection.batch.fixed_size(batch_size=batch_size, concurrent_requests=concurrent_requests) as batch:
+        uuids = [batch.add_object(properties=properties, references=references, uuid=uuid)
+                 for properties, references, uuid in zip(objects, refs, uuids)]
+    
+    failed = collection.batch.failed_objects
+    if failed:
+        raise RuntimeError(f"{len(failed)} objects failed to insert: {failed[0].message}")
+    return uuids
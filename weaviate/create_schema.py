@@ -8,719 +8,852 @@ Date: 2025-02-13
 
 import weaviate
 from weaviate.classes.config import Configure, Property, DataType, ReferenceProperty, VectorDistances
+from weaviate.exceptions import WeaviateConnectionError, WeaviateStartUpError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
+from typing import Final
+import csv
+import logging
 import sys
-import traceback
 import os
+import time
+import uuid
+
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAMES: Final[tuple[str, ...]] = ("Entity", "Insight", "Strategy", "Event", "Process")
+
+# HNSW parameters shared by every collection
+HNSW_EF_CONSTRUCTION = 256  # Build-time candidate list; higher = better graph, slower imports
+HNSW_M = 16                 # Max connections per node; drives index memory
+HNSW_EF_QUERY = 64          # Query-time candidate list; recall vs latency
+
+# Vector compression: "none" (default), "sq" (int8, ~4x smaller) or "pq"
+# (product codes); opt in with NEBULA_QUANTIZATION=sq|pq. Compression trades
+# some recall for memory. SQ/PQ train on the first QUANTIZATION_TRAINING_LIMIT
+# vectors of each collection; until that many objects exist, vectors are
+# stored uncompressed.
+QUANTIZATION = os.environ.get("NEBULA_QUANTIZATION", "none").lower()
+QUANTIZATION_TRAINING_LIMIT = 100_000
+PQ_SEGMENTS = 96  # Must divide the vector dimension (384 for all-MiniLM-L6-v2)
+PQ_CENTROIDS = 256
+
+
+def vector_quantizer():
+    """Quantizer config for the HNSW index according to QUANTIZATION"""
+    if QUANTIZATION == "sq":
+        return Configure.VectorIndex.Quantizer.sq(training_limit=QUANTIZATION_TRAINING_LIMIT)
+    if QUANTIZATION == "pq":
+        return Configure.VectorIndex.Quantizer.pq(
+            segments=PQ_SEGMENTS,
+            centroids=PQ_CENTROIDS,
+            training_limit=QUANTIZATION_TRAINING_LIMIT
+        )
+    if QUANTIZATION == "none":
+        return None
+    raise ValueError(f"Unknown QUANTIZATION setting: {QUANTIZATION!r}")
 
 
-def create_entity_collection(client):
-    """Create Entity collection with text2vec-transformers auto-vectorization"""
-
-    client.collections.create(
-        name="Entity",
-        description="Organizations, teams, products, projects, and people that appear in knowledge base",
-
-        # Configure text2vec-transformers vectorizer
-        vectorizer_config=Configure.Vectorizer.text2vec_transformers(
-            pooling_strategy="masked_mean",  # Options: masked_mean, cls
-            vectorize_collection_name=False
-        ),
-
-        vector_index_config=Configure.VectorIndex.hnsw(
-            distance_metric=VectorDistances.COSINE
-        ),
-        
-        properties=[
-            Property(
-                name="name",
-                data_type=DataType.TEXT,
-                description="Display name of the entity (e.g., 'KPMG', 'Make Product Team', 'NebulaOS')",
-                index_filterable=True,
-                index_searchable=True,
-                vectorize_property_name=False,  # Don't include property name in vector
-                skip_vectorization=False  # Include in vectorization
-            ),
-            Property(
-                name="entity_type",
-                data_type=DataType.TEXT,
-                description="Type: company | team | product | project | conference | community | person",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True  # Don't vectorize metadata fields
-            ),
-            Property(
-                name="domain",
-                data_type=DataType.TEXT,
-                description="Domain filter: personal | work | both",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="description",
-                data_type=DataType.TEXT,
-                description="Brief context about this entity - what it is, why it matters",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="notes",
-                data_type=DataType.TEXT,
-                description="Running notes: what works with them, preferences, history, quirks",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="status",
-                data_type=DataType.TEXT,
-                description="Lifecycle status: active | inactive | archived",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="created_at",
-                data_type=DataType.DATE,
-                description="Creation timestamp",
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="updated_at",
-                data_type=DataType.DATE,
-                description="Last update timestamp",
-                index_filterable=True,
-                skip_vectorization=True
-            )
-        ]
+def vectorizer_config():
+    """text2vec-transformers vectorizer shared by all collections"""
+    return Configure.Vectorizer.text2vec_transformers(
+        pooling_strategy="masked_mean",  # Options: masked_mean, cls
+        vectorize_collection_name=False
     )
-    print("✅ Created Entity collection with auto-vectorization")
-
 
-def create_strategy_collection(client):
-    """Create Strategy collection with auto-vectorization"""
 
-    client.collections.create(
-        name="Strategy",
-        description="Goals, priorities, frameworks, principles, mental models - decision-making knowledge",
-
-        vectorizer_config=Configure.Vectorizer.text2vec_transformers(
-            pooling_strategy="masked_mean",
-            vectorize_collection_name=False
-        ),
-
-        vector_index_config=Configure.VectorIndex.hnsw(
-            distance_metric=VectorDistances.COSINE
-        ),
-        
-        properties=[
-            Property(
-                name="title",
-                data_type=DataType.TEXT,
-                description="Descriptive title (e.g., 'Q1 2025 Product Priorities', 'RICE Framework')",
-                index_filterable=True,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="content",
-                data_type=DataType.TEXT,
-                description="Full description of the strategy, framework, or principle",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="strategy_type",
-                data_type=DataType.TEXT,
-                description="Type: goal | framework | principle | priority | mental_model | methodology",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="domain",
-                data_type=DataType.TEXT,
-                description="Domain filter: personal | work | both",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="time_horizon",
-                data_type=DataType.TEXT,
-                description="Timeframe: evergreen | quarterly | yearly | project-bound",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="valid_from",
-                data_type=DataType.DATE,
-                description="When this strategy becomes active",
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="valid_until",
-                data_type=DataType.DATE,
-                description="When this strategy expires (null = no expiry)",
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="status",
-                data_type=DataType.TEXT,
-                description="Lifecycle status: active | superseded | archived",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="superseded_by",
-                data_type=DataType.UUID,
-                description="Reference to newer Strategy UUID that replaces this one",
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="created_at",
-                data_type=DataType.DATE,
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="updated_at",
-                data_type=DataType.DATE,
-                index_filterable=True,
-                skip_vectorization=True
-            )
-        ],
-
-        references=[
-            ReferenceProperty(
-                name="appliesToEntities",
-                target_collection="Entity",
-                description="Entities this strategy applies to or involves"
-            ),
-            ReferenceProperty(
-                name="relatedStrategies",
-                target_collection="Strategy",
-                description="Parent strategies, supporting frameworks, related goals"
-            )
-        ]
+def vector_index_config(ef_construction=HNSW_EF_CONSTRUCTION, max_connections=HNSW_M, ef=HNSW_EF_QUERY):
+    """HNSW index config; defaults come from the module-level tunables"""
+    return Configure.VectorIndex.hnsw(
+        distance_metric=VectorDistances.COSINE,
+        ef_construction=ef_construction,
+        max_connections=max_connections,
+        ef=ef,
+        quantizer=vector_quantizer()
     )
-    print("✅ Created Strategy collection with auto-vectorization")
 
 
-def create_insight_collection(client):
-    """Create Insight collection with auto-vectorization"""
-
-    client.collections.create(
-        name="Insight",
-        description="Atomic knowledge units - learnings, observations, ideas, patterns, mental models",
-
-        vectorizer_config=Configure.Vectorizer.text2vec_transformers(
-            pooling_strategy="masked_mean",
-            vectorize_collection_name=False
-        ),
-
-        vector_index_config=Configure.VectorIndex.hnsw(
-            distance_metric=VectorDistances.COSINE
-        ),
-        
-        properties=[
-            Property(
-                name="content",
-                data_type=DataType.TEXT,
-                description="The insight itself, written to be self-contained and clear",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="source_name",
-                data_type=DataType.TEXT,
-                description="Origin reference: article title, video name, book, conversation topic",
-                index_filterable=True,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="source_type",
-                data_type=DataType.TEXT,
-                description="Type: article | video | book | podcast | conversation | reflection | research",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="domain",
-                data_type=DataType.TEXT,
-                description="Domain filter: personal | work | both",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="tags",
-                data_type=DataType.TEXT_ARRAY,
-                description="Flexible categorization for filtering (e.g., ai-agents, prompt-engineering)",
-                index_filterable=True,
-                index_searchable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="status",
-                data_type=DataType.TEXT,
-                description="Lifecycle status: active | superseded | archived",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="superseded_by",
-                data_type=DataType.UUID,
-                description="Reference to newer Insight UUID that replaces this one",
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="confidence",
-                data_type=DataType.TEXT,
-                description="Confidence level: high | medium | low | hypothesis",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="created_at",
-                data_type=DataType.DATE,
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="updated_at",
-                data_type=DataType.DATE,
-                index_filterable=True,
-                skip_vectorization=True
-            )
-        ],
-
-        references=[
-            ReferenceProperty(
-                name="relatedStrategies",
-                target_collection="Strategy",
-                description="Strategies this insight informs or supports"
-            ),
-            ReferenceProperty(
-                name="relatedEntities",
-                target_collection="Entity",
-                description="Entities this insight relates to"
-            ),
-            ReferenceProperty(
-                name="relatedInsights",
-                target_collection="Insight",
-                description="Other insights that connect to this one"
-            )
-        ]
+# ============================================================================
+# COLLECTION DEFINITIONS
+# ============================================================================
+#
+# Inverted-index policy: BM25 (index_searchable) is kept on the fields that are
+# keyword-searched - names, titles, primary content/summary, source names, tags
+# and participants. Long display-only fields (notes, outcomes, action items, ...)
+# are neither searchable nor filterable, which saves tokenization and posting
+# list updates on every insert; they still feed the vector.
+
+_ENTITY_PROPS = [
+    Property(
+        name="name",
+        data_type=DataType.TEXT,
+        description="Display name of the entity (e.g., 'KPMG', 'Make Product Team', 'NebulaOS')",
+        index_filterable=True,
+        index_searchable=True,
+        vectorize_property_name=False,  # Don't include property name in vector
+        skip_vectorization=False  # Include in vectorization
+    ),
+    Property(
+        name="entity_type",
+        data_type=DataType.TEXT,
+        description="Type: company | team | product | project | conference | community | person",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True  # Don't vectorize metadata fields
+    ),
+    Property(
+        name="domain",
+        data_type=DataType.TEXT,
+        description="Domain filter: personal | work | both",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="description",
+        data_type=DataType.TEXT,
+        description="Brief context about this entity - what it is, why it matters",
+        index_filterable=False,
+        index_searchable=False,  # Display-only; still vectorized
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="notes",
+        data_type=DataType.TEXT,
+        description="Running notes: what works with them, preferences, history, quirks",
+        index_filterable=False,
+        index_searchable=False,  # Display-only; still vectorized
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="status",
+        data_type=DataType.TEXT,
+        description="Lifecycle status: active | inactive | archived",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="created_at",
+        data_type=DataType.DATE,
+        description="Creation timestamp",
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="updated_at",
+        data_type=DataType.DATE,
+        description="Last update timestamp",
+        index_filterable=True,
+        skip_vectorization=True
     )
-    print("✅ Created Insight collection with auto-vectorization")
-
-
-def create_event_collection(client):
-    """Create Event collection with auto-vectorization"""
+]
+
+
+_STRATEGY_PROPS = [
+    Property(
+        name="title",
+        data_type=DataType.TEXT,
+        description="Descriptive title (e.g., 'Q1 2025 Product Priorities', 'RICE Framework')",
+        index_filterable=True,
+        index_searchable=True,
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="content",
+        data_type=DataType.TEXT,
+        description="Full description of the strategy, framework, or principle",
+        index_filterable=False,
+        index_searchable=True,
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="strategy_type",
+        data_type=DataType.TEXT,
+        description="Type: goal | framework | principle | priority | mental_model | methodology",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="domain",
+        data_type=DataType.TEXT,
+        description="Domain filter: personal | work | both",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="time_horizon",
+        data_type=DataType.TEXT,
+        description="Timeframe: evergreen | quarterly | yearly | project-bound",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="valid_from",
+        data_type=DataType.DATE,
+        description="When this strategy becomes active",
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="valid_until",
+        data_type=DataType.DATE,
+        description="When this strategy expires (null = no expiry)",
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="status",
+        data_type=DataType.TEXT,
+        description="Lifecycle status: active | superseded | archived",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="superseded_by",
+        data_type=DataType.UUID,
+        description="Reference to newer Strategy UUID that replaces this one",
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="created_at",
+        data_type=DataType.DATE,
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="updated_at",
+        data_type=DataType.DATE,
+        index_filterable=True,
+        skip_vectorization=True
+    )
+]
+
+
+_STRATEGY_REFS = [
+    ReferenceProperty(
+        name="appliesToEntities",
+        target_collection="Entity",
+        description="Entities this strategy applies to or involves"
+    ),
+    ReferenceProperty(
+        name="relatedStrategies",
+        target_collection="Strategy",
+        description="Parent strategies, supporting frameworks, related goals"
+    )
+]
+
+
+_INSIGHT_PROPS = [
+    Property(
+        name="content",
+        data_type=DataType.TEXT,
+        description="The insight itself, written to be self-contained and clear",
+        index_filterable=False,
+        index_searchable=True,
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="source_name",
+        data_type=DataType.TEXT,
+        description="Origin reference: article title, video name, book, conversation topic",
+        index_filterable=True,
+        index_searchable=True,
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="source_type",
+        data_type=DataType.TEXT,
+        description="Type: article | video | book | podcast | conversation | reflection | research",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="domain",
+        data_type=DataType.TEXT,
+        description="Domain filter: personal | work | both",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="tags",
+        data_type=DataType.TEXT_ARRAY,
+        description="Flexible categorization for filtering (e.g., ai-agents, prompt-engineering)",
+        index_filterable=True,
+        index_searchable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="status",
+        data_type=DataType.TEXT,
+        description="Lifecycle status: active | superseded | archived",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="superseded_by",
+        data_type=DataType.UUID,
+        description="Reference to newer Insight UUID that replaces this one",
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="confidence",
+        data_type=DataType.TEXT,
+        description="Confidence level: high | medium | low | hypothesis",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="created_at",
+        data_type=DataType.DATE,
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="updated_at",
+        data_type=DataType.DATE,
+        index_filterable=True,
+        skip_vectorization=True
+    )
+]
+
+
+_INSIGHT_REFS = [
+    ReferenceProperty(
+        name="relatedStrategies",
+        target_collection="Strategy",
+        description="Strategies this insight informs or supports"
+    ),
+    ReferenceProperty(
+        name="relatedEntities",
+        target_collection="Entity",
+        description="Entities this insight relates to"
+    ),
+    ReferenceProperty(
+        name="relatedInsights",
+        target_collection="Insight",
+        description="Other insights that connect to this one"
+    )
+]
+
+
+_EVENT_PROPS = [
+    Property(
+        name="title",
+        data_type=DataType.TEXT,
+        description="Event name (e.g., 'KPMG Workshop Planning', 'Q1 Roadmap Decision')",
+        index_filterable=True,
+        index_searchable=True,
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="event_type",
+        data_type=DataType.TEXT,
+        description="Type: meeting | decision | milestone | announcement | workshop | review",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="summary",
+        data_type=DataType.TEXT,
+        description="What happened - key discussion points, context",
+        index_filterable=False,
+        index_searchable=True,
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="participants",
+        data_type=DataType.TEXT_ARRAY,
+        description="Names with optional context: ['Marie (Product)', 'Jean (KPMG)']",
+        index_filterable=True,
+        index_searchable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="domain",
+        data_type=DataType.TEXT,
+        description="Domain filter: personal | work | both",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="event_date",
+        data_type=DataType.DATE,
+        description="When this event occurred (ISO 8601 format)",
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="outcomes",
+        data_type=DataType.TEXT,
+        description="Decisions made, conclusions reached",
+        index_filterable=False,
+        index_searchable=False,  # Display-only; still vectorized
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="action_items",
+        data_type=DataType.TEXT,
+        description="Tasks assigned, next steps agreed",
+        index_filterable=False,
+        index_searchable=False,  # Display-only; still vectorized
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="open_questions",
+        data_type=DataType.TEXT,
+        description="Unresolved items, parking lot topics",
+        index_filterable=False,
+        index_searchable=False,  # Display-only; still vectorized
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="created_at",
+        data_type=DataType.DATE,
+        index_filterable=True,
+        skip_vectorization=True
+    )
+]
+
+
+_EVENT_REFS = [
+    ReferenceProperty(
+        name="involvesEntities",
+        target_collection="Entity",
+        description="Organizations/teams involved (not individual participants)"
+    ),
+    ReferenceProperty(
+        name="relatesToStrategies",
+        target_collection="Strategy",
+        description="Strategies discussed or affected by this event"
+    ),
+    ReferenceProperty(
+        name="generatedInsights",
+        target_collection="Insight",
+        description="Insights that emerged from this event"
+    )
+]
+
+
+_PROCESS_PROPS = [
+    Property(
+        name="title",
+        data_type=DataType.TEXT,
+        description="Process name (e.g., 'Stakeholder Update Cadence', 'Workshop Delivery Checklist')",
+        index_filterable=True,
+        index_searchable=True,
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="content",
+        data_type=DataType.TEXT,
+        description="The process itself - steps, principles, checklist",
+        index_filterable=False,
+        index_searchable=True,
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="domain",
+        data_type=DataType.TEXT,
+        description="Domain filter: personal | work | both",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="triggers",
+        data_type=DataType.TEXT,
+        description="When to use this process: conditions, cues, schedules",
+        index_filterable=False,
+        index_searchable=False,  # Display-only; still vectorized
+        vectorize_property_name=False,
+        skip_vectorization=False
+    ),
+    Property(
+        name="status",
+        data_type=DataType.TEXT,
+        description="Lifecycle status: active | superseded | archived",
+        index_filterable=True,
+        index_searchable=False,
+        skip_vectorization=True
+    ),
+    Property(
+        name="superseded_by",
+        data_type=DataType.UUID,
+        description="Reference to newer Process UUID that replaces this one",
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="created_at",
+        data_type=DataType.DATE,
+        index_filterable=True,
+        skip_vectorization=True
+    ),
+    Property(
+        name="updated_at",
+        data_type=DataType.DATE,
+        index_filterable=True,
+        skip_vectorization=True
+    )
+]
+
+
+_PROCESS_REFS = [
+    ReferenceProperty(
+        name="appliesToEntities",
+        target_collection="Entity",
+        description="Entities this process is used with"
+    ),
+    ReferenceProperty(
+        name="relatedStrategies",
+        target_collection="Strategy",
+        description="Strategies this process supports or implements"
+    )
+]
+
+
+# Collection name -> create() arguments; "vector_index" holds per-collection
+# overrides of the HNSW tunables, e.g. {"ef": 128}
+SCHEMA = {
+    "Entity": {
+        "description": "Organizations, teams, products, projects, and people that appear in knowledge base",
+        "properties": _ENTITY_PROPS,
+        "references": [],
+        "vector_index": {}
+    },
+    "Strategy": {
+        "description": "Goals, priorities, frameworks, principles, mental models - decision-making knowledge",
+        "properties": _STRATEGY_PROPS,
+        "references": _STRATEGY_REFS,
+        "vector_index": {}
+    },
+    "Insight": {
+        "description": "Atomic knowledge units - learnings, observations, ideas, patterns, mental models",
+        "properties": _INSIGHT_PROPS,
+        "references": _INSIGHT_REFS,
+        "vector_index": {}
+    },
+    "Event": {
+        "description": "Point-in-time occurrences - meetings, decisions, milestones, announcements",
+        "properties": _EVENT_PROPS,
+        "references": _EVENT_REFS,
+        "vector_index": {}
+    },
+    "Process": {
+        "description": "Procedures, workflows, how-tos - operational knowledge for recurring activities",
+        "properties": _PROCESS_PROPS,
+        "references": _PROCESS_REFS,
+        "vector_index": {}
+    }
+}
+
+
+def create_collection(client, name):
+    """Create one collection from its SCHEMA entry with auto-vectorization"""
+    schema = SCHEMA[name]
 
     client.collections.create(
-        name="Event",
-        description="Point-in-time occurrences - meetings, decisions, milestones, announcements",
-
-        vectorizer_config=Configure.Vectorizer.text2vec_transformers(
-            pooling_strategy="masked_mean",
-            vectorize_collection_name=False
-        ),
-
-        vector_index_config=Configure.VectorIndex.hnsw(
-            distance_metric=VectorDistances.COSINE
-        ),
-        
-        properties=[
-            Property(
-                name="title",
-                data_type=DataType.TEXT,
-                description="Event name (e.g., 'KPMG Workshop Planning', 'Q1 Roadmap Decision')",
-                index_filterable=True,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="event_type",
-                data_type=DataType.TEXT,
-                description="Type: meeting | decision | milestone | announcement | workshop | review",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="summary",
-                data_type=DataType.TEXT,
-                description="What happened - key discussion points, context",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="participants",
-                data_type=DataType.TEXT_ARRAY,
-                description="Names with optional context: ['Marie (Product)', 'Jean (KPMG)']",
-                index_filterable=True,
-                index_searchable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="domain",
-                data_type=DataType.TEXT,
-                description="Domain filter: personal | work | both",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="event_date",
-                data_type=DataType.DATE,
-                description="When this event occurred (ISO 8601 format)",
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="outcomes",
-                data_type=DataType.TEXT,
-                description="Decisions made, conclusions reached",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="action_items",
-                data_type=DataType.TEXT,
-                description="Tasks assigned, next steps agreed",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="open_questions",
-                data_type=DataType.TEXT,
-                description="Unresolved items, parking lot topics",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="created_at",
-                data_type=DataType.DATE,
-                index_filterable=True,
-                skip_vectorization=True
-            )
-        ],
-
-        references=[
-            ReferenceProperty(
-                name="involvesEntities",
-                target_collection="Entity",
-                description="Organizations/teams involved (not individual participants)"
-            ),
-            ReferenceProperty(
-                name="relatesToStrategies",
-                target_collection="Strategy",
-                description="Strategies discussed or affected by this event"
-            ),
-            ReferenceProperty(
-                name="generatedInsights",
-                target_collection="Insight",
-                description="Insights that emerged from this event"
-            )
-        ]
+        name=name,
+        description=schema["description"],
+        vectorizer_config=vectorizer_config(),
+        vector_index_config=vector_index_config(**schema["vector_index"]),
+        properties=schema["properties"],
+        references=schema["references"] or None
     )
-    print("✅ Created Event collection with auto-vectorization")
+    logger.info("✅ Created %s collection with auto-vectorization", name)
 
 
-def create_process_collection(client):
-    """Create Process collection with auto-vectorization"""
+def _validate_one(client, collection_name):
+    """Fetch one collection's config; returns (name, prop_count, ref_count, vectorizer, error)"""
+    try:
+        collection = client.collections.get(collection_name)
+        config = collection.config.get()
 
-    client.collections.create(
-        name="Process",
-        description="Procedures, workflows, how-tos - operational knowledge for recurring activities",
+        # Count properties
+        prop_count = len(config.properties)
 
-        vectorizer_config=Configure.Vectorizer.text2vec_transformers(
-            pooling_strategy="masked_mean",
-            vectorize_collection_name=False
-        ),
+        # Count references (if they exist)
+        ref_count = len(config.references) if hasattr(config, 'references') and config.references else 0
 
-        vector_index_config=Configure.VectorIndex.hnsw(
-            distance_metric=VectorDistances.COSINE
-        ),
-        
-        properties=[
-            Property(
-                name="title",
-                data_type=DataType.TEXT,
-                description="Process name (e.g., 'Stakeholder Update Cadence', 'Workshop Delivery Checklist')",
-                index_filterable=True,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="content",
-                data_type=DataType.TEXT,
-                description="The process itself - steps, principles, checklist",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="domain",
-                data_type=DataType.TEXT,
-                description="Domain filter: personal | work | both",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="triggers",
-                data_type=DataType.TEXT,
-                description="When to use this process: conditions, cues, schedules",
-                index_filterable=False,
-                index_searchable=True,
-                vectorize_property_name=False,
-                skip_vectorization=False
-            ),
-            Property(
-                name="status",
-                data_type=DataType.TEXT,
-                description="Lifecycle status: active | superseded | archived",
-                index_filterable=True,
-                index_searchable=False,
-                skip_vectorization=True
-            ),
-            Property(
-                name="superseded_by",
-                data_type=DataType.UUID,
-                description="Reference to newer Process UUID that replaces this one",
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="created_at",
-                data_type=DataType.DATE,
-                index_filterable=True,
-                skip_vectorization=True
-            ),
-            Property(
-                name="updated_at",
-                data_type=DataType.DATE,
-                index_filterable=True,
-                skip_vectorization=True
-            )
-        ],
-
-        references=[
-            ReferenceProperty(
-                name="appliesToEntities",
-                target_collection="Entity",
-                description="Entities this process is used with"
-            ),
-            ReferenceProperty(
-                name="relatedStrategies",
-                target_collection="Strategy",
-                description="Strategies this process supports or implements"
-            )
-        ]
-    )
-    print("✅ Created Process collection with auto-vectorization")
+        # Check vectorizer
+        vectorizer = "none"
+        if hasattr(config, 'vectorizer_config') and config.vectorizer_config:
+            vectorizer = getattr(config.vectorizer_config, 'vectorizer', 'unknown')
 
+        return collection_name, prop_count, ref_count, vectorizer, None
 
-def add_insight_strategy_reference(client):
-    """Add the informedByInsights reference to Strategy collection after Insight exists"""
-    
-    try:
-        # Get Strategy collection
-        strategy_collection = client.collections.get("Strategy")
-        
-        # Note: In Weaviate v4 client, we need to update the collection config
-        # This requires recreating with all references, which was done in create_strategy_collection
-        # The reference is added via client.collections.config.add_reference()
-        
-        # For now, log that the mutual references are handled by creation order
-        print("   Note: Strategy->Insight reference handled via creation order")
-        
     except Exception as e:
-        print(f"   Warning: Could not update Strategy references: {e}")
+        return collection_name, 0, 0, None, e
 
 
 def validate_schema(client):
     """Validate all collections were created correctly"""
 
-    print("\n📋 Schema Validation:")
+    logger.info("\n📋 Schema Validation:")
 
-    collections = ["Entity", "Insight", "Strategy", "Event", "Process"]
     all_valid = True
 
-    for collection_name in collections:
-        try:
-            collection = client.collections.get(collection_name)
-            config = collection.config.get()
+    # Config fetches are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=len(COLLECTION_NAMES)) as executor:
+        results = list(executor.map(lambda name: _validate_one(client, name), COLLECTION_NAMES))
+
+    for collection_name, prop_count, ref_count, vectorizer, error in results:
+        if error is not None:
+            logger.error("  ❌ %s: %s", collection_name, error)
+            all_valid = False
+        else:
+            logger.info("  ✅ %s: %s properties, %s references, vectorizer: %s", collection_name, prop_count, ref_count, vectorizer)
 
-            # Count properties
-            prop_count = len(config.properties)
+    return all_valid
 
-            # Count references (if they exist)
-            ref_count = len(config.references) if hasattr(config, 'references') and config.references else 0
 
-            # Check vectorizer
-            vectorizer = "none"
-            if hasattr(config, 'vectorizer_config') and config.vectorizer_config:
-                vectorizer = getattr(config.vectorizer_config, 'vectorizer', 'unknown')
+class PhaseTimer:
+    """Wall-clock milliseconds per named phase, measured with perf_counter_ns"""
 
-            print(f"  ✅ {collection_name}: {prop_count} properties, {ref_count} references, vectorizer: {vectorizer}")
+    def __init__(self):
+        self.timings = {}
+        self._phase = None
+        self._start = 0
 
-        except Exception as e:
-            print(f"  ❌ {collection_name}: {str(e)}")
-            all_valid = False
+    def start(self, phase):
+        self.stop()
+        self._phase = phase
+        self._start = time.perf_counter_ns()
 
-    return all_valid
+    def stop(self):
+        """End the running phase (if any) and return all timings so far"""
+        if self._phase is not None:
+            elapsed_ms = (time.perf_counter_ns() - self._start) / 1e6
+            self.timings[self._phase] = elapsed_ms
+            logger.info("     ⏱  %s: %.2f ms", self._phase, elapsed_ms)
+            self._phase = None
+        return self.timings
+
+
+def write_timings_csv(path, timings):
+    """Append one row per phase to a CSV file, writing the header for a new file"""
+    new_file = not os.path.exists(path)
+    recorded_at = datetime.now(timezone.utc).isoformat()
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(["recorded_at", "phase", "ms"])
+        for phase, elapsed_ms in timings.items():
+            writer.writerow([recorded_at, phase, f"{elapsed_ms:.3f}"])
 
 
 def run_validation_tests(client):
-    """Run comprehensive validation tests with auto-vectorization"""
+    """
+    Run comprehensive validation tests with auto-vectorization
+    
+    Returns (passed, timings) where timings maps each phase to milliseconds.
+    """
 
-    print("\n🧪 Running Validation Tests\n")
+    logger.info("\n🧪 Running Validation Tests\n")
+
+    now = datetime.now(timezone.utc)
+    timer = PhaseTimer()
 
     # Test 1: Check all collections exist
-    print("Test 1: Collection Existence")
-    collections = ["Entity", "Insight", "Strategy", "Event", "Process"]
-    for name in collections:
+    logger.info("Test 1: Collection Existence")
+    timer.start("collection_existence")
+    for name in COLLECTION_NAMES:
         try:
             client.collections.get(name)
-            print(f"  ✅ {name} exists")
+            logger.info("  ✅ %s exists", name)
         except Exception as e:
-            print(f"  ❌ {name} missing: {e}")
-            return False
+            logger.error("  ❌ %s missing: %s", name, e)
+            return False, timer.stop()
 
-    # Test 2: Create test entity WITHOUT providing vector
-    print("\nTest 2: Auto-Vectorization Test")
+    # Test 2: Create test objects WITHOUT providing vectors
+    timer.stop()
+    logger.info("\nTest 2: Auto-Vectorization Test")
+    timer.start("batch_insert")
 
+    # Both test objects go in one batch; client-side UUIDs let the insight
+    # reference the entity before either has been written
     entity_collection = client.collections.get("Entity")
-    test_uuid = entity_collection.data.insert(
-        properties={
-            "name": "Test Company",
-            "entity_type": "company",
-            "domain": "work",
-            "description": "Test entity for validation with automatic embedding generation",
-            "status": "active",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        }
-        # Note: No vector parameter - it will be auto-generated!
-    )
-    print(f"  ✅ Created test entity: {test_uuid}")
-    print(f"     Vector auto-generated by text2vec-transformers")
+    insight_collection = client.collections.get("Insight")
+    test_uuid = uuid.uuid4()
+    insight_uuid = uuid.uuid4()
+
+    with client.batch.dynamic() as batch:
+        batch.add_object(
+            collection="Entity",
+            uuid=test_uuid,
+            properties={
+                "name": "Test Company",
+                "entity_type": "company",
+                "domain": "work",
+                "description": "Test entity for validation with automatic embedding generation",
+                "status": "active",
+                "created_at": now,
+                "updated_at": now
+            }
+            # Note: No vector parameter - it will be auto-generated!
+        )
+        batch.add_object(
+            collection="Insight",
+            uuid=insight_uuid,
+            properties={
+                "content": "Test insight with automatic embedding and cross-reference",
+                "source_type": "reflection",
+                "domain": "work",
+                "tags": ["test"],
+                "status": "active",
+                "confidence": "low",
+                "created_at": now,
+                "updated_at": now
+            },
+            references={
+                "relatedEntities": [test_uuid]
+            }
+            # No vector needed - auto-generated!
+        )
+
+    failed = client.batch.failed_objects
+    if failed:
+        logger.error("  ❌ Batch insert failed: %s", failed[0].message)
+        return False, timer.stop()
+
+    logger.info("  ✅ Created test entity: %s", test_uuid)
+    logger.info("     Vector auto-generated by text2vec-transformers")
     
     # Test 3: Query test entity
-    print("\nTest 3: Query by Property")
+    timer.stop()
+    logger.info("\nTest 3: Query by Property")
+    timer.start("property_query")
     response = entity_collection.query.fetch_objects(
         filters=weaviate.classes.query.Filter.by_property("name").equal("Test Company"),
         limit=1
     )
     
     if response.objects:
-        print(f"  ✅ Query successful: {response.objects[0].properties['name']}")
+        logger.info("  ✅ Query successful: %s", response.objects[0].properties['name'])
     else:
-        print("  ❌ Query failed")
-        return False
+        logger.error("  ❌ Query failed")
+        return False, timer.stop()
     
     # Test 4: Vector search with text query
-    print("\nTest 4: Near Text Search")
+    timer.stop()
+    logger.info("\nTest 4: Near Text Search")
+    timer.start("near_text")
     vector_response = entity_collection.query.near_text(
         query="company business organization",
         limit=1
     )
 
     if vector_response.objects:
-        print(f"  ✅ Near text search successful: {vector_response.objects[0].properties['name']}")
+        logger.info("  ✅ Near text search successful: %s", vector_response.objects[0].properties['name'])
     else:
-        print("  ❌ Near text search failed")
-        return False
+        logger.error("  ❌ Near text search failed")
+        return False, timer.stop()
     
     # Test 5: Cross-reference with auto-vectorization
-    print("\nTest 5: Cross-Reference with Auto-Vectorization")
-    insight_collection = client.collections.get("Insight")
-    insight_uuid = insight_collection.data.insert(
-        properties={
-            "content": "Test insight with automatic embedding and cross-reference",
-            "source_type": "reflection",
-            "domain": "work",
-            "tags": ["test"],
-            "status": "active",
-            "confidence": "low",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        },
-        references={
-            "relatedEntities": [test_uuid]
-        }
-        # No vector needed - auto-generated!
-    )
-    print(f"  ✅ Created insight with reference: {insight_uuid}")
-    print(f"     Vector auto-generated from content field")
+    timer.stop()
+    logger.info("\nTest 5: Cross-Reference with Auto-Vectorization")
+    logger.info("  ✅ Created insight with reference: %s", insight_uuid)
+    logger.info("     Vector auto-generated from content field")
     
     # Test 6: Query with reference
-    print("\nTest 6: Query with Cross-Reference")
+    logger.info("\nTest 6: Query with Cross-Reference")
+    timer.start("reference_query")
     from weaviate.classes.query import QueryReference
     
-    insight_response = insight_collection.query.fetch_objects(
-        filters=weaviate.classes.query.Filter.by_property("content").like("Test insight*"),
-        return_references=[QueryReference(link_on="relatedEntities")],
-        limit=1
+    # We know the UUID, so look it up directly instead of a wildcard scan on content
+    insight_obj = insight_collection.query.fetch_object_by_id(
+        insight_uuid,
+        return_references=[QueryReference(link_on="relatedEntities")]
     )
     
-    if insight_response.objects and insight_response.objects[0].references:
-        related_entities = insight_response.objects[0].references.get("relatedEntities")
+    if insight_obj and insight_obj.references:
+        related_entities = insight_obj.references.get("relatedEntities")
         if related_entities and related_entities.objects:
-            print(f"  ✅ Reference query successful: linked to {related_entities.objects[0].properties['name']}")
+            logger.info("  ✅ Reference query successful: linked to %s", related_entities.objects[0].properties['name'])
         else:
-            print("  ⚠️  Reference exists but objects not returned")
+            logger.warning("  ⚠️  Reference exists but objects not returned")
     else:
-        print("  ❌ Reference query failed")
+        logger.error("  ❌ Reference query failed")
     
     # Cleanup
-    print("\nCleaning up test objects...")
+    timer.stop()
+    logger.info("\nCleaning up test objects...")
+    timer.start("cleanup")
     entity_collection.data.delete_by_id(test_uuid)
     insight_collection.data.delete_by_id(insight_uuid)
-    print("  ✅ Cleanup complete")
+    timer.stop()
+    logger.info("  ✅ Cleanup complete")
     
-    return True
+    return True, timer.timings
+
+
+READY_BACKOFF = (0.1, 0.2, 0.5, 1, 2, 5)  # Seconds between connection attempts; the last repeats
+
+
+def connect_until_ready(connect, timeout=None):
+    """
+    Call connect() with exponential backoff until the node is up and ready
+    
+    The client's connect step fetches /v1/meta unconditionally and raises
+    WeaviateConnectionError/WeaviateStartUpError while the node is still
+    starting, so the retry has to wrap the connect call itself rather than
+    poll an existing client. Gives up
+    after `timeout` seconds (default: WEAVIATE_READY_TIMEOUT or 30).
+    """
+    if timeout is None:
+        timeout = float(os.environ.get("WEAVIATE_READY_TIMEOUT", "30"))
+    deadline = time.monotonic() + timeout
+
+    attempt = 0
+    while True:
+        error = None
+        try:
+            client = connect()
+        except (WeaviateConnectionError, WeaviateStartUpError) as e:
+            error = e
+        else:
+            if client.is_ready():
+                return client
+            client.close()
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Weaviate not ready after {timeout:g}s") from error
+        time.sleep(min(READY_BACKOFF[min(attempt, len(READY_BACKOFF) - 1)], remaining))
+        attempt += 1
 
 
 def connect_to_weaviate(local=True, host=None, http_port=8081, grpc_port=50051):
     """
-    Connect to Weaviate instance
+    Connect to Weaviate instance, retrying until the node is ready
     
     Args:
         local: If True, connect to localhost
@@ -730,32 +863,28 @@ def connect_to_weaviate(local=True, host=None, http_port=8081, grpc_port=50051):
     """
     # Get API key from environment
     api_key = os.environ.get("WEAVIATE_API_KEY")
+    auth = weaviate.auth.AuthApiKey(api_key) if api_key else None
     
     if local:
-        print(f"🔌 Connecting to local Weaviate instance on port {http_port}...")
+        logger.info("🔌 Connecting to local Weaviate instance on port %s...", http_port)
         if api_key:
-            print("   Using API key authentication")
-            client = weaviate.connect_to_local(
-                host="localhost",
-                port=http_port,
-                grpc_port=grpc_port,
-                auth_credentials=weaviate.auth.AuthApiKey(api_key)
-            )
+            logger.info("   Using API key authentication")
         else:
-            print("   No API key found, attempting anonymous access")
-            client = weaviate.connect_to_local(
-                host="localhost",
-                port=http_port,
-                grpc_port=grpc_port
-            )
+            logger.info("   No API key found, attempting anonymous access")
+        connect = partial(
+            weaviate.connect_to_local,
+            host="localhost",
+            port=http_port,
+            grpc_port=grpc_port,
+            auth_credentials=auth
+        )
     else:
         if not host:
             raise ValueError("Host must be provided for remote connection")
-        print(f"🔌 Connecting to remote Weaviate at {host}:{http_port}...")
-        
-        auth = weaviate.auth.AuthApiKey(api_key) if api_key else None
+        logger.info("🔌 Connecting to remote Weaviate at %s:%s...", host, http_port)
         
-        client = weaviate.connect_to_custom(
+        connect = partial(
+            weaviate.connect_to_custom,
             http_host=host,
             http_port=http_port,
             http_secure=False,
@@ -765,84 +894,87 @@ def connect_to_weaviate(local=True, host=None, http_port=8081, grpc_port=50051):
             auth_credentials=auth
         )
     
-    return client
+    return connect_until_ready(connect)
 
 
 def main():
     """Main execution function"""
 
-    print("=" * 60)
-    print("🚀 NebulaOS Schema Creation with text2vec-transformers")
-    print("=" * 60)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    logger.info("=" * 60)
+    logger.info("🚀 NebulaOS Schema Creation with text2vec-transformers")
+    logger.info("=" * 60)
 
     # Connect to Weaviate
     try:
         client = connect_to_weaviate(local=True)
-        print(f"✅ Connected: {client.is_ready()}\n")
+        logger.info("✅ Connected: %s\n", client.is_connected())
     except Exception as e:
-        print(f"❌ Connection failed: {str(e)}")
-        print("\nPlease ensure:")
-        print("  1. Weaviate is running")
-        print("  2. text2vec-transformers inference service is running")
-        print("  3. Connection details are correct")
-        print("  4. Run: pip install weaviate-client")
-        print("  5. WEAVIATE_API_KEY is set if authentication is required")
+        logger.error("❌ Connection failed: %s", e)
+        logger.info("\nPlease ensure:")
+        logger.info("  1. Weaviate is running")
+        logger.info("  2. text2vec-transformers inference service is running")
+        logger.info("  3. Connection details are correct")
+        logger.info("  4. Run: pip install weaviate-client")
+        logger.info("  5. WEAVIATE_API_KEY is set if authentication is required")
         return 1
     
     try:
-        print("📦 Creating collections with auto-vectorization...\n")
-
-        # Create collections in correct dependency order
-        # 1. Entity first (no dependencies)
-        create_entity_collection(client)
-
-        # 2. Strategy - references Entity and itself (self-reference is OK)
-        create_strategy_collection(client)
-
-        # 3. Insight - references Entity, Strategy, and itself
-        create_insight_collection(client)
-
-        # 4. Event - references Entity, Strategy, and Insight
-        create_event_collection(client)
-
-        # 5. Process - references Entity and Strategy
-        create_process_collection(client)
+        logger.info("📦 Creating collections with auto-vectorization...\n")
+
+        # Create collections in dependency layers; a layer only references
+        # collections from earlier layers, so its members can be created concurrently
+        layers = [
+            ["Entity"],             # No dependencies
+            ["Strategy"],           # References Entity and itself
+            ["Insight"],            # References Entity, Strategy, and itself
+            ["Event", "Process"],   # Event references Entity, Strategy, and Insight;
+                                    # Process references Entity and Strategy
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for layer in layers:
+                for future in [executor.submit(create_collection, client, name) for name in layer]:
+                    future.result()
 
-        print("\n" + "=" * 60)
+        logger.info("\n" + "=" * 60)
 
         # Validate schema
         if not validate_schema(client):
-            print("\n⚠️  Schema validation found issues")
+            logger.warning("\n⚠️  Schema validation found issues")
             return 1
 
-        print("\n" + "=" * 60)
+        logger.info("\n" + "=" * 60)
 
         # Run tests
-        if not run_validation_tests(client):
-            print("\n⚠️  Validation tests found issues")
+        passed, timings = run_validation_tests(client)
+        perf_csv = os.environ.get("NEBULA_PERF_CSV")
+        if perf_csv:
+            write_timings_csv(perf_csv, timings)
+        if not passed:
+            logger.warning("\n⚠️  Validation tests found issues")
             return 1
 
-        print("\n" + "=" * 60)
-        print("✅ Schema creation complete!")
-        print("\n📝 Key Features:")
-        print("  ✓ Automatic vectorization with text2vec-transformers")
-        print("  ✓ No need to manually generate embeddings")
-        print("  ✓ Near text search enabled")
-        print("  ✓ Semantic search out of the box")
-        print("\n📝 Next steps:")
-        print("  1. Insert data without worrying about vectors")
-        print("  2. Use near_text() for semantic queries")
-        print("  3. Vectors are generated automatically on insert")
-        print("  4. See example_auto_vectorization.py for usage examples")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("✅ Schema creation complete!")
+        logger.info("\n📝 Key Features:")
+        logger.info("  ✓ Automatic vectorization with text2vec-transformers")
+        logger.info("  ✓ No need to manually generate embeddings")
+        logger.info("  ✓ Near text search enabled")
+        logger.info("  ✓ Semantic search out of the box")
+        logger.info("\n📝 Next steps:")
+        logger.info("  1. Insert data without worrying about vectors")
+        logger.info("  2. Use near_text() for semantic queries")
+        logger.info("  3. Vectors are generated automatically on insert")
+        logger.info("  4. See example_auto_vectorization.py for usage examples")
+        logger.info("=" * 60)
         
     except Exception as e:
-        print(f"\n❌ Error: {str(e)}")
-        traceback.print_exc()
+        logger.exception("\n❌ Error: %s", e)
         return 1
     finally:
         client.close()
-        print("\n🔌 Connection closed")
+        logger.info("\n🔌 Connection closed")
     
     return 0
 
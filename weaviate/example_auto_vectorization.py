@@ -4,23 +4,76 @@ Example: Adding insights with automatic vectorization
 No need to generate vectors manually!
 """
 
-import weaviate
+from collections import OrderedDict
 from datetime import datetime, timezone
-import os
+import asyncio
+import sys
+import time
+import uuid
 
+from _client import batch_insert, coll, get_client
 
-def connect():
-    """Connect to Weaviate"""
-    api_key = os.environ.get("WEAVIATE_API_KEY")
-    
-    client = weaviate.connect_to_local(
-        host="localhost",
-        port=8081,
-        grpc_port=50051,
-        auth_credentials=weaviate.auth.AuthApiKey(api_key) if api_key else None
+
+NEAR_TEXT_CACHE_SIZE = 256
+NEAR_TEXT_TTL_SECONDS = 60
+
+# (collection, query, filters, limit, properties) -> (result objects, fetched at)
+_near_text_cache = OrderedDict()
+
+
+def invalidate_near_text_cache():
+    """Drop all cached search results, e.g. after inserting new objects"""
+    _near_text_cache.clear()
+
+
+def cached_near_text(client, collection_name, query, filters=None, limit=3, return_properties=None):
+    """
+    near_text search whose results are reused for repeated identical queries
+    
+    Keeps the NEAR_TEXT_CACHE_SIZE most recently used results for up to
+    NEAR_TEXT_TTL_SECONDS, so a repeated query skips both the model forward
+    pass and the vector search. Returns a list of result objects.
+    """
+    key = (collection_name, query, str(filters), limit, tuple(return_properties or ()))
+    now = time.monotonic()
+    
+    entry = _near_text_cache.get(key)
+    if entry is not None and now - entry[1] < NEAR_TEXT_TTL_SECONDS:
+        _near_text_cache.move_to_end(key)
+        return list(entry[0])
+    
+    response = coll(client, collection_name).query.near_text(
+        query=query,
+        filters=filters,
+        limit=limit,
+        include_vector=False,
+        return_properties=return_properties
     )
     
-    return client
+    _near_text_cache[key] = (response.objects, now)
+    _near_text_cache.move_to_end(key)
+    if len(_near_text_cache) > NEAR_TEXT_CACHE_SIZE:
+        _near_text_cache.popitem(last=False)
+    return list(response.objects)
+
+
+def add_insights_bulk(client, items):
+    """
+    Add many insights in one batch import
+    
+    items is a list of Insight property dicts, optionally carrying a
+    "references" key. Vectors are generated server-side, and objects go
+    through the shared batch_insert() instead of one request per insight.
+    Returns the new UUIDs in the order of items.
+    """
+    try:
+        return batch_insert(
+            client, "Insight",
+            [{key: value for key, value in item.items() if key != "references"} for item in items],
+            refs=[item.get("references") for item in items]
+        )
+    finally:
+        invalidate_near_text_cache()
 
 
 def add_insight_example(client):
@@ -34,7 +87,7 @@ def add_insight_example(client):
     print("=" * 60)
     print()
     
-    insight_collection = client.collections.get("Insight")
+    now = datetime.now(timezone.utc)
     
     # Just provide the properties - no vector needed!
     insight_data = {
@@ -49,8 +102,8 @@ def add_insight_example(client):
         "tags": ["weaviate", "embedding", "vectorization", "automation"],
         "status": "active",
         "confidence": "high",
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc)
+        "created_at": now,
+        "updated_at": now
     }
     
     print("Inserting insight...")
@@ -58,7 +111,7 @@ def add_insight_example(client):
     print()
     
     # Insert without vector parameter
-    insight_uuid = insight_collection.data.insert(properties=insight_data)
+    insight_uuid, = add_insights_bulk(client, [insight_data])
     
     print(f"✅ Successfully inserted insight!")
     print(f"   UUID: {insight_uuid}")
@@ -78,31 +131,58 @@ def semantic_search_example(client):
     print("=" * 60)
     print()
     
-    insight_collection = client.collections.get("Insight")
-    
     # Search using natural language query
     query = "automatic embedding generation"
     print(f"Searching for: '{query}'")
     print()
     
-    results = insight_collection.query.near_text(
-        query=query,
-        limit=3
+    # Only the printed fields come back from the server, without vectors
+    results = cached_near_text(
+        client, "Insight", query,
+        limit=3,
+        return_properties=["content", "tags", "confidence"]
     )
     
-    print(f"Found {len(results.objects)} results:")
+    print(f"Found {len(results)} results:")
     print()
     
-    for i, obj in enumerate(results.objects, 1):
+    # Build the whole result listing and write it once
+    lines = []
+    for i, obj in enumerate(results, 1):
         content = obj.properties['content']
         # Truncate for display
         if len(content) > 150:
             content = content[:150] + "..."
         
-        print(f"{i}. {content}")
-        print(f"   Tags: {', '.join(obj.properties.get('tags', []))}")
-        print(f"   Confidence: {obj.properties.get('confidence', 'N/A')}")
-        print()
+        lines.append(f"{i}. {content}")
+        lines.append(f"   Tags: {', '.join(obj.properties.get('tags', []))}")
+        lines.append(f"   Confidence: {obj.properties.get('confidence', 'N/A')}")
+        lines.append("")
+    sys.stdout.write("".join(line + "\n" for line in lines))
+
+
+async def run_queries(client, queries, limit=5, filters=None):
+    """
+    Run several near_text searches on Insight concurrently
+    
+    client is an async client (see _client.async_client()). All queries are
+    in flight together, so the inference service can embed them in parallel;
+    give the transformers container OMP_NUM_THREADS > 1 to make use of that.
+    Returns one list of result objects per query, in the order of queries.
+    """
+    insight_collection = coll(client, "Insight")
+    
+    responses = await asyncio.gather(*[
+        insight_collection.query.near_text(
+            query=query,
+            filters=filters,
+            limit=limit,
+            include_vector=False,
+            return_properties=["content", "tags", "confidence"]
+        )
+        for query in queries
+    ])
+    return [response.objects for response in responses]
 
 
 def add_entity_with_insight_reference(client):
@@ -115,48 +195,60 @@ def add_entity_with_insight_reference(client):
     print("=" * 60)
     print()
     
-    # First, add an entity
-    entity_collection = client.collections.get("Entity")
-    
-    entity_uuid = entity_collection.data.insert(
-        properties={
-            "name": "Weaviate",
-            "entity_type": "product",
-            "domain": "work",
-            "description": "Open-source vector database with built-in vectorization capabilities",
-            "notes": "Supports multiple vectorizer modules including text2vec-transformers",
-            "status": "active",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        }
-    )
+    now = datetime.now(timezone.utc)
+    
+    # Client-side UUIDs let the insight reference the entity before either
+    # has been written, so both go in a single batch
+    entity_uuid = uuid.uuid4()
+    insight_uuid = uuid.uuid4()
+    
+    with client.batch.fixed_size(batch_size=100, concurrent_requests=2) as batch:
+        batch.add_object(
+            collection="Entity",
+            uuid=entity_uuid,
+            properties={
+                "name": "Weaviate",
+                "entity_type": "product",
+                "domain": "work",
+                "description": "Open-source vector database with built-in vectorization capabilities",
+                "notes": "Supports multiple vectorizer modules including text2vec-transformers",
+                "status": "active",
+                "created_at": now,
+                "updated_at": now
+            }
+        )
+        
+        # Now add an insight that references this entity
+        batch.add_object(
+            collection="Insight",
+            uuid=insight_uuid,
+            properties={
+                "content": (
+                    "Weaviate's modular architecture allows you to choose different "
+                    "vectorizers based on your needs - from lightweight local models "
+                    "to cloud-based APIs."
+                ),
+                "source_type": "reflection",
+                "domain": "work",
+                "tags": ["architecture", "flexibility"],
+                "status": "active",
+                "confidence": "high",
+                "created_at": now,
+                "updated_at": now
+            },
+            references={
+                "relatedEntities": [entity_uuid]
+            }
+        )
+    
+    invalidate_near_text_cache()
+    
+    failed = client.batch.failed_objects
+    if failed:
+        raise RuntimeError(f"{len(failed)} objects failed to insert: {failed[0].message}")
     
     print(f"✅ Created Entity: {entity_uuid}")
     print()
-    
-    # Now add an insight that references this entity
-    insight_collection = client.collections.get("Insight")
-    
-    insight_uuid = insight_collection.data.insert(
-        properties={
-            "content": (
-                "Weaviate's modular architecture allows you to choose different "
-                "vectorizers based on your needs - from lightweight local models "
-                "to cloud-based APIs."
-            ),
-            "source_type": "reflection",
-            "domain": "work",
-            "tags": ["architecture", "flexibility"],
-            "status": "active",
-            "confidence": "high",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        },
-        references={
-            "relatedEntities": [entity_uuid]
-        }
-    )
-    
     print(f"✅ Created Insight: {insight_uuid}")
     print(f"   Linked to Entity: {entity_uuid}")
     print()
@@ -176,26 +268,34 @@ def query_with_filters(client):
     
     from weaviate.classes.query import Filter
     
-    insight_collection = client.collections.get("Insight")
-    
     # Search for insights about automation, but only high confidence ones
-    results = insight_collection.query.near_text(
-        query="automation and efficiency",
+    results = cached_near_text(
+        client, "Insight", "automation and efficiency",
         filters=Filter.by_property("confidence").equal("high"),
-        limit=5
+        limit=5,
+        return_properties=["content", "confidence"]
     )
     
-    print(f"Found {len(results.objects)} high-confidence insights about automation:")
+    print(f"Found {len(results)} high-confidence insights about automation:")
     print()
     
-    for obj in results.objects:
-        print(f"- {obj.properties['content'][:100]}...")
-        print(f"  Confidence: {obj.properties['confidence']}")
-        print()
+    sys.stdout.write("".join(
+        f"- {obj.properties['content'][:100]}...\n"
+        f"  Confidence: {obj.properties['confidence']}\n\n"
+        for obj in results
+    ))
 
 
-def main():
-    """Run all examples"""
+def _warmup_vectorizer(client):
+    """Run one throwaway near_text so the first example doesn't pay the model's cold start"""
+    try:
+        coll(client, "Insight").query.near_text(query="warmup", limit=1)
+    except Exception:
+        pass  # Warmup is best-effort; real failures surface in the examples
+
+
+def main(client=None):
+    """Run all examples on the given client, or the shared get_client() one"""
     
     print("\n")
     print("=" * 60)
@@ -206,7 +306,7 @@ def main():
     # Connect
     try:
         print("Connecting to Weaviate...")
-        client = connect()
+        client = client or get_client()
         print(f"✅ Connected: {client.is_ready()}")
         print()
     except Exception as e:
@@ -217,6 +317,9 @@ def main():
         print("  3. Schema was created with create_schema_with_vectorizer.py")
         return 1
     
+    # warm t2v-transformers model
+    _warmup_vectorizer(client)
+    
     try:
         # Example 1: Simple insert
         insight_uuid = add_insight_example(client)
@@ -259,13 +362,9 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
-    finally:
-        client.close()
-        print("Connection closed.\n")
     
     return 0
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -40,11 +40,25 @@ else
     echo "  ENABLE_MODULES=text2vec-transformers"
     echo "  DEFAULT_VECTORIZER_MODULE=text2vec-transformers"
     echo "  TRANSFORMERS_INFERENCE_API=http://t2v-transformers:8080"
+    echo "  ASYNC_INDEXING=true"
     echo ""
     echo -e "${YELLOW}Note:${NC} You'll need to recreate your Weaviate container with these settings."
     NEEDS_RESTART=true
 fi
 
+if docker inspect weaviate-secure --format '{{range .Config.Env}}{{println .}}{{end}}' | grep -q "ASYNC_INDEXING=true"; then
+    echo -e "${GREEN}✓${NC} Async vector indexing is enabled"
+else
+    echo -e "${YELLOW}!${NC} ASYNC_INDEXING is not enabled - inserts will block on HNSW indexing"
+    echo "  Add ASYNC_INDEXING=true to the Weaviate container environment for faster imports"
+fi
+
+# The -onnx inference image is CPU-only; on a GPU host the PyTorch image with CUDA is faster
+if command -v nvidia-smi > /dev/null 2>&1 && nvidia-smi > /dev/null 2>&1; then
+    echo -e "${YELLOW}!${NC} GPU detected - for GPU inference, drop the -onnx suffix from the image"
+    echo "  in docker-compose-vectorizer.yml and set ENABLE_CUDA: '1'"
+fi
+
 # Check if transformers inference service is running
 echo ""
 echo "Step 3: Checking transformers inference service..."
@@ -81,7 +95,8 @@ if [ "$NEEDS_RESTART" = true ]; then
     echo ""
     echo "  -e ENABLE_MODULES=text2vec-transformers \\"
     echo "  -e DEFAULT_VECTORIZER_MODULE=text2vec-transformers \\"
-    echo "  -e TRANSFORMERS_INFERENCE_API=http://t2v-transformers:8080"
+    echo "  -e TRANSFORMERS_INFERENCE_API=http://t2v-transformers:8080 \\"
+    echo "  -e ASYNC_INDEXING=true"
     echo ""
     echo "If you're using docker-compose, add these to the environment section"
     echo "and run: docker-compose up -d"
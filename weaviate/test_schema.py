@@ -3,28 +3,23 @@
 Test and validate NebulaOS Weaviate collections
 """
 
-import weaviate
+from weaviate.classes.data import DataObject
 from weaviate.classes.query import QueryReference, Filter
 from datetime import datetime, timezone
-import os
+from typing import Final
+import asyncio
+import numpy as np
 import sys
+import uuid
 
+from _client import async_client, coll
 
-def connect():
-    """Connect to Weaviate"""
-    api_key = os.environ.get("WEAVIATE_API_KEY")
-    
-    client = weaviate.connect_to_local(
-        host="localhost",
-        port=8081,
-        grpc_port=50051,
-        auth_credentials=weaviate.auth.AuthApiKey(api_key) if api_key else None
-    )
-    
-    return client
+
+# Dummy 768-dimensional vector, built once as packed float32 and shared by all tests
+TEST_VECTOR: Final = np.full(768, 0.1, dtype=np.float32)
 
 
-def validate_collections(client):
+async def validate_collections(client):
     """Validate all collections exist with correct schema"""
     
     print("=" * 60)
@@ -35,10 +30,18 @@ def validate_collections(client):
     collections = ["Entity", "Insight", "Strategy", "Event", "Process"]
     all_valid = True
     
+    # One schema read for all five collections instead of a config.get() each
+    try:
+        all_configs = await client.collections.list_all()
+    except Exception as e:
+        print(f"❌ Schema read failed: {str(e)}\n")
+        return False
+    
     for collection_name in collections:
         try:
-            collection = client.collections.get(collection_name)
-            config = collection.config.get()
+            config = all_configs.get(collection_name)
+            if config is None:
+                raise LookupError("collection not found")
             
             # Count properties
             prop_count = len(config.properties)
@@ -64,89 +67,60 @@ def validate_collections(client):
     return all_valid
 
 
-def test_basic_operations(client):
-    """Test basic CRUD operations"""
+async def test_basic_operations(client=None):
+    """
+    Test basic CRUD operations, overlapping independent round trips
+    
+    Runs on the given async client, or opens one for the duration of the test.
+    """
     
     print("=" * 60)
     print("🧪 Testing Basic Operations")
     print("=" * 60)
     print()
     
-    test_vector = [0.1] * 768  # Dummy 768-dimensional vector
+    if client is not None:
+        return await _basic_operations(client)
+    async with async_client() as client:
+        return await _basic_operations(client)
+
+
+async def _basic_operations(client):
+    now = datetime.now(timezone.utc)
+    entity_collection = coll(client, "Entity")
+    insight_collection = coll(client, "Insight")
     
-    # Test 1: Create Entity
-    print("Test 1: Create Entity")
-    entity_collection = client.collections.get("Entity")
-    entity_uuid = entity_collection.data.insert(
-        properties={
+    # Client-side UUIDs let each object reference the others before any of
+    # them has been written, so all four collections are written at once
+    entity_uuid = uuid.uuid4()
+    strategy_uuid = uuid.uuid4()
+    insight_uuid = uuid.uuid4()
+    event_uuid = uuid.uuid4()
+    
+    test_objects = [
+        ("Entity", entity_uuid, {
             "name": "Test Company XYZ",
             "entity_type": "company",
             "domain": "work",
             "description": "A test company for validation purposes",
             "notes": "This is a test entity",
             "status": "active",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        },
-        vector=test_vector
-    )
-    print(f"  ✅ Created Entity: {entity_uuid}\n")
-    
-    # Test 2: Query by property
-    print("Test 2: Query by Property")
-    response = entity_collection.query.fetch_objects(
-        filters=Filter.by_property("name").equal("Test Company XYZ"),
-        limit=1
-    )
-    
-    if response.objects:
-        obj = response.objects[0]
-        print(f"  ✅ Found: {obj.properties['name']}")
-        print(f"     Type: {obj.properties['entity_type']}")
-        print(f"     Domain: {obj.properties['domain']}\n")
-    else:
-        print("  ❌ Query failed\n")
-        return False
-    
-    # Test 3: Vector search
-    print("Test 3: Vector Search")
-    vector_response = entity_collection.query.near_vector(
-        near_vector=test_vector,
-        limit=3
-    )
-    
-    print(f"  ✅ Found {len(vector_response.objects)} results via vector search")
-    for obj in vector_response.objects:
-        print(f"     • {obj.properties['name']}")
-    print()
-    
-    # Test 4: Create Strategy with reference
-    print("Test 4: Create Strategy with Entity Reference")
-    strategy_collection = client.collections.get("Strategy")
-    strategy_uuid = strategy_collection.data.insert(
-        properties={
+            "created_at": now,
+            "updated_at": now
+        }, None),
+        ("Strategy", strategy_uuid, {
             "title": "Test Q1 Strategy",
             "content": "Focus on testing and validation",
             "strategy_type": "priority",
             "domain": "work",
             "time_horizon": "quarterly",
             "status": "active",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        },
-        vector=test_vector,
-        references={
+            "created_at": now,
+            "updated_at": now
+        }, {
             "appliesToEntities": [entity_uuid]
-        }
-    )
-    print(f"  ✅ Created Strategy: {strategy_uuid}")
-    print(f"     Linked to Entity: {entity_uuid}\n")
-    
-    # Test 5: Create Insight with multiple references
-    print("Test 5: Create Insight with Multiple References")
-    insight_collection = client.collections.get("Insight")
-    insight_uuid = insight_collection.data.insert(
-        properties={
+        }),
+        ("Insight", insight_uuid, {
             "content": "Testing cross-references is crucial for data integrity",
             "source_name": "Weaviate Testing Guide",
             "source_type": "article",
@@ -154,29 +128,111 @@ def test_basic_operations(client):
             "tags": ["testing", "data-integrity", "weaviate"],
             "status": "active",
             "confidence": "high",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        },
-        vector=test_vector,
-        references={
+            "created_at": now,
+            "updated_at": now
+        }, {
             "relatedEntities": [entity_uuid],
             "relatedStrategies": [strategy_uuid]
-        }
-    )
+        }),
+        ("Event", event_uuid, {
+            "title": "Test Planning Meeting",
+            "event_type": "meeting",
+            "summary": "Discussed testing strategy and validation procedures",
+            "participants": ["Alice (Engineering)", "Bob (Product)"],
+            "domain": "work",
+            "event_date": now,
+            "outcomes": "Agreed on comprehensive testing approach",
+            "action_items": "1. Write tests\n2. Run validation\n3. Document results",
+            "created_at": now
+        }, {
+            "involvesEntities": [entity_uuid],
+            "relatesToStrategies": [strategy_uuid],
+            "generatedInsights": [insight_uuid]
+        }),
+    ]
+    
+    # Test 1: Batch create Entity, Strategy, Insight and Event
+    # One insert_many batch per collection, all four in flight together
+    print("Test 1: Batch Create Entity, Strategy, Insight and Event")
+    results = await asyncio.gather(*[
+        coll(client, collection_name).data.insert_many([
+            DataObject(properties=properties, references=references, uuid=object_uuid, vector=TEST_VECTOR)
+        ])
+        for collection_name, object_uuid, properties, references in test_objects
+    ], return_exceptions=True)
+    
+    for (collection_name, _, _, _), result in zip(test_objects, results):
+        if isinstance(result, Exception):
+            print(f"  ❌ Batch insert into {collection_name} failed: {result}\n")
+            return False
+        if result.errors:
+            print(f"  ❌ Batch insert into {collection_name} failed: {next(iter(result.errors.values())).message}\n")
+            return False
+    
+    print(f"  ✅ Created Entity: {entity_uuid}")
+    print(f"  ✅ Created Strategy: {strategy_uuid}")
+    print(f"     Linked to Entity: {entity_uuid}")
     print(f"  ✅ Created Insight: {insight_uuid}")
-    print(f"     Linked to Entity and Strategy\n")
+    print(f"     Linked to Entity and Strategy")
+    print(f"  ✅ Created Event: {event_uuid}")
+    print(f"     Linked to Entity, Strategy, and Insight\n")
     
-    # Test 6: Query with cross-references
-    print("Test 6: Query with Cross-References")
-    insight_response = insight_collection.query.fetch_objects(
-        filters=Filter.by_property("content").like("*cross-references*"),
-        return_references=[
-            QueryReference(link_on="relatedEntities"),
-            QueryReference(link_on="relatedStrategies")
-        ],
-        limit=1
+    # Tests 2-5 only read the objects written above, so run them together
+    response, vector_response, insight_response, work_entities = await asyncio.gather(
+        entity_collection.query.fetch_objects(
+            filters=Filter.by_property("name").equal("Test Company XYZ"),
+            limit=1,
+            # Each query returns only the properties its test prints
+            return_properties=["name", "entity_type", "domain"]
+        ),
+        entity_collection.query.near_vector(
+            near_vector=TEST_VECTOR,
+            limit=3,
+            include_vector=False,
+            return_properties=["name"]
+        ),
+        # BM25 hits the tokenized inverted index; a leading-wildcard like()
+        # filter would scan every content value
+        insight_collection.query.bm25(
+            query="cross-references",
+            query_properties=["content"],
+            return_properties=["content"],
+            return_references=[
+                QueryReference(link_on="relatedEntities", return_properties=["name"]),
+                QueryReference(link_on="relatedStrategies", return_properties=["title"])
+            ],
+            limit=1
+        ),
+        entity_collection.query.fetch_objects(
+            filters=(
+                Filter.by_property("domain").equal("work") &
+                Filter.by_property("status").equal("active")
+            ),
+            limit=10,
+            return_properties=["name", "entity_type"]
+        )
     )
     
+    # Test 2: Query by property
+    print("Test 2: Query by Property")
+    if response.objects:
+        obj = response.objects[0]
+        print(f"  ✅ Found: {obj.properties['name']}")
+        print(f"     Type: {obj.properties['entity_type']}")
+        print(f"     Domain: {obj.properties['domain']}\n")
+    else:
+        print("  ❌ Query failed\n")
+        return False
+    
+    # Test 3: Vector search
+    print("Test 3: Vector Search")
+    print(f"  ✅ Found {len(vector_response.objects)} results via vector search")
+    # One write per result set instead of one print per object
+    sys.stdout.write("".join(f"     • {obj.properties['name']}\n" for obj in vector_response.objects))
+    print()
+    
+    # Test 4: Query with cross-references
+    print("Test 4: Query with Cross-References")
     if insight_response.objects:
         obj = insight_response.objects[0]
         print(f"  ✅ Found Insight: {obj.properties['content'][:50]}...")
@@ -193,59 +249,34 @@ def test_basic_operations(client):
     else:
         print("  ❌ Query with references failed\n")
     
-    # Test 7: Create Event with multiple references
-    print("Test 7: Create Event with Multiple References")
-    event_collection = client.collections.get("Event")
-    event_uuid = event_collection.data.insert(
-        properties={
-            "title": "Test Planning Meeting",
-            "event_type": "meeting",
-            "summary": "Discussed testing strategy and validation procedures",
-            "participants": ["Alice (Engineering)", "Bob (Product)"],
-            "domain": "work",
-            "event_date": datetime.now(timezone.utc),
-            "outcomes": "Agreed on comprehensive testing approach",
-            "action_items": "1. Write tests\n2. Run validation\n3. Document results",
-            "created_at": datetime.now(timezone.utc)
-        },
-        vector=test_vector,
-        references={
-            "involvesEntities": [entity_uuid],
-            "relatesToStrategies": [strategy_uuid],
-            "generatedInsights": [insight_uuid]
-        }
-    )
-    print(f"  ✅ Created Event: {event_uuid}")
-    print(f"     Linked to Entity, Strategy, and Insight\n")
-    
-    # Test 8: Complex query
-    print("Test 8: Complex Filter Query")
-    work_entities = entity_collection.query.fetch_objects(
-        filters=(
-            Filter.by_property("domain").equal("work") &
-            Filter.by_property("status").equal("active")
-        ),
-        limit=10
-    )
-    
+    # Test 5: Complex query
+    print("Test 5: Complex Filter Query")
     print(f"  ✅ Found {len(work_entities.objects)} active work entities")
-    for obj in work_entities.objects:
-        print(f"     • {obj.properties['name']} ({obj.properties['entity_type']})")
+    sys.stdout.write("".join(
+        f"     • {obj.properties['name']} ({obj.properties['entity_type']})\n"
+        for obj in work_entities.objects
+    ))
     print()
     
-    # Cleanup
+    # Cleanup: one delete_many per collection, all in flight together
     print("Cleanup: Removing test objects...")
-    entity_collection.data.delete_by_id(entity_uuid)
-    strategy_collection.data.delete_by_id(strategy_uuid)
-    insight_collection.data.delete_by_id(insight_uuid)
-    event_collection.data.delete_by_id(event_uuid)
+    uuids_by_collection = {}
+    for collection_name, object_uuid, _, _ in test_objects:
+        uuids_by_collection.setdefault(collection_name, []).append(object_uuid)
+    
+    await asyncio.gather(*[
+        coll(client, collection_name).data.delete_many(
+            where=Filter.by_id().contains_any(object_uuids)
+        )
+        for collection_name, object_uuids in uuids_by_collection.items()
+    ])
     print("  ✅ Cleanup complete\n")
     
     return True
 
 
-def show_collection_stats(client):
-    """Show statistics for all collections"""
+async def show_collection_stats(client=None):
+    """Show statistics for all collections, on the given async client or a new one"""
     
     print("=" * 60)
     print("📊 Collection Statistics")
@@ -254,50 +285,78 @@ def show_collection_stats(client):
     
     collections = ["Entity", "Insight", "Strategy", "Event", "Process"]
     
-    for collection_name in collections:
-        try:
-            collection = client.collections.get(collection_name)
-            
-            # Get object count
-            response = collection.aggregate.over_all(total_count=True)
-            count = response.total_count
-            
-            print(f"{collection_name}: {count} objects")
-            
-        except Exception as e:
-            print(f"{collection_name}: Error - {e}")
+    # Get object counts, all five aggregates in flight together
+    if client is not None:
+        responses = await _collection_counts(client, collections)
+    else:
+        async with async_client() as client:
+            responses = await _collection_counts(client, collections)
+    
+    sys.stdout.write("".join(
+        f"{collection_name}: Error - {response}\n" if isinstance(response, Exception)
+        else f"{collection_name}: {response.total_count} objects\n"
+        for collection_name, response in zip(collections, responses)
+    ))
     
     print()
 
 
-def main():
-    """Main test runner"""
+async def _collection_counts(client, collections):
+    return await asyncio.gather(*[
+        coll(client, collection_name).aggregate.over_all(total_count=True)
+        for collection_name in collections
+    ], return_exceptions=True)
+
+
+def main(client=None):
+    """
+    Main test runner
+    
+    Runs every phase on the given async client, or on a new async_client()
+    one. Callers already inside an event loop should await main_async().
+    """
+    return asyncio.run(main_async(client))
+
+
+async def main_async(client=None):
+    """Run the tests on one async client, closing it only if created here"""
     
     print("=" * 60)
     print("🔬 NebulaOS Weaviate Collections - Validation Test")
     print("=" * 60)
     print()
     
-    # Connect
+    owned = client is None
     try:
         print("🔌 Connecting to Weaviate...")
-        client = connect()
-        print(f"✅ Connected: {client.is_ready()}\n")
+        client = client or async_client()
+        if not client.is_connected():
+            await client.connect()
+        print(f"✅ Connected: {await client.is_ready()}\n")
     except Exception as e:
         print(f"❌ Connection failed: {str(e)}")
         return 1
     
+    try:
+        return await _run_tests(client)
+    finally:
+        if owned:
+            await client.close()
+            print("\n🔌 Connection closed")
+
+
+async def _run_tests(client):
     try:
         # Validate schema
-        if not validate_collections(client):
+        if not await validate_collections(client):
             print("❌ Schema validation failed")
             return 1
         
         # Show current stats
-        show_collection_stats(client)
+        await show_collection_stats(client)
         
         # Run tests
-        if not test_basic_operations(client):
+        if not await test_basic_operations(client):
             print("❌ Basic operations test failed")
             return 1
         
@@ -325,9 +384,6 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
-    finally:
-        client.close()
-        print("\n🔌 Connection closed")
     
     return 0
 